@@ -0,0 +1,221 @@
+# Standart Library
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Django Library
+from django.core.files.storage import default_storage
+from django.db.models import Model, QuerySet
+from django.urls import reverse
+
+# Local Imports
+from blog.models import Category, Comment, Post, User
+
+# Resources of JSON API: which fields objects have and how to load them.
+#
+# Every field knows model columns it needs (for only())
+# and relations to join (for select_related()),
+# so the query of a response loads just requested fields
+# and never goes for related objects one by one.
+
+
+class ApiError(Exception):
+    """
+    Error shown to API client as {"detail": message} with status.
+    """
+    def __init__(self, detail: str, status: int = 400):
+        super().__init__(detail)
+        self.detail = detail
+        self.status = status
+
+
+class ApiField:
+    """
+    Field of API resource.
+
+    ...
+
+    Attributes:
+    -----------
+    value: Callable
+        takes object, returns JSON serializable value
+    only: tuple
+        model fields (with __ for related ones) to load
+    related: tuple
+        relations to load with select_related
+    """
+    def __init__(
+        self,
+        value: Callable[[Model], Any],
+        only: Tuple[str, ...] = (),
+        related: Tuple[str, ...] = (),
+    ):
+        self.value = value
+        self.only = only
+        self.related = related
+
+
+def attribute(name: str) -> ApiField:
+    # Field shown as is from model field with the same name.
+    return ApiField(lambda obj: getattr(obj, name), only=(name,))
+
+
+def username_of(relation: str) -> ApiField:
+    return ApiField(
+        lambda obj: getattr(obj, relation).username,
+        only=(relation, f'{relation}__username'),
+        related=(relation,),
+    )
+
+
+class Resource:
+    """
+    Set of fields of API objects and the queryset they come from.
+
+    ...
+
+    Subclasses define model, fields, ordering (unique, used by
+    cursor pagination) and get_queryset() with visibility rules.
+    Clients pick fields with ?fields=a,b, all of them by default.
+    """
+    model = None
+    fields: Dict[str, ApiField] = {}
+    ordering: Tuple[str, ...] = ('pk',)
+
+    def get_queryset(self) -> QuerySet:
+        return self.model.objects.all()
+
+    def parse_fields(self, value: Optional[str]) -> List[str]:
+        if not value:
+            return list(self.fields)
+        names = [name.strip() for name in value.split(',') if name.strip()]
+        unknown = [name for name in names if name not in self.fields]
+        if unknown or not names:
+            raise ApiError(
+                f'Неизвестные поля: {", ".join(unknown)}. '
+                f'Доступны: {", ".join(self.fields)}.'
+            )
+        return list(dict.fromkeys(names))
+
+    def select(self, queryset: QuerySet, names: Iterable[str]) -> QuerySet:
+        # Load columns of requested fields and of ordering,
+        # which cursor of the page is made of.
+        pk = self.model._meta.pk.name
+        only = {pk} | {pk if field == 'pk' else field
+                       for field in (name.lstrip('-')
+                                     for name in self.ordering)}
+        related = set()
+        for name in names:
+            only.update(self.fields[name].only)
+            related.update(self.fields[name].related)
+        if related:
+            # Without arguments it would follow all relations.
+            queryset = queryset.select_related(*sorted(related))
+        return queryset.only(*sorted(only))
+
+    def serialize(self, obj: Model, names: Iterable[str]) -> Dict[str, Any]:
+        return {name: self.fields[name].value(obj) for name in names}
+
+
+def _image(post: Post) -> Optional[Dict[str, Any]]:
+    if not post.image:
+        return None
+    return {
+        'url': post.image.url,
+        'variants': {
+            variant: {image_format: default_storage.url(name)
+                      for image_format, name in formats.items()}
+            for variant, formats in (post.image_variants or {}).items()
+        },
+    }
+
+
+def _location(post: Post) -> Optional[str]:
+    location = post.location
+    if location is None or not location.is_published:
+        return None
+    return location.name
+
+
+class CategoryResource(Resource):
+    model = Category
+    fields = {
+        'id': attribute('id'),
+        'slug': attribute('slug'),
+        'title': attribute('title'),
+        'description': attribute('description'),
+        'url': ApiField(
+            lambda category: reverse(
+                'blog:category_posts', args=(category.slug,)
+            ),
+            only=('slug',),
+        ),
+    }
+
+    def get_queryset(self) -> QuerySet:
+        return Category.objects.filter(is_published=True)
+
+
+class PostResource(Resource):
+    model = Post
+    fields = {
+        'id': attribute('id'),
+        'title': attribute('title'),
+        'text': attribute('text'),
+        'pub_date': attribute('pub_date'),
+        'author': username_of('author'),
+        'category': ApiField(
+            lambda post: post.category.slug,
+            only=('category', 'category__slug'),
+            related=('category',),
+        ),
+        'location': ApiField(
+            _location,
+            only=('location', 'location__name', 'location__is_published'),
+            related=('location',),
+        ),
+        'image': ApiField(_image, only=('image', 'image_variants')),
+        'comments_count': attribute('comments_count'),
+        'url': ApiField(
+            lambda post: reverse('blog:post_detail', args=(post.pk,)),
+        ),
+    }
+    ordering = ('-pub_date', '-pk')
+
+    def get_queryset(self) -> QuerySet:
+        return Post.published_posts.all()
+
+
+class CommentResource(Resource):
+    model = Comment
+    fields = {
+        'id': attribute('id'),
+        'post': ApiField(lambda comment: comment.post_id, only=('post',)),
+        'parent': ApiField(
+            lambda comment: comment.parent_id, only=('parent',)
+        ),
+        'depth': attribute('depth'),
+        'author': username_of('author'),
+        'text': attribute('text'),
+        'created_at': attribute('created_at'),
+    }
+    # Threads depth-first, oldest first.
+    ordering = ('path',)
+
+    def get_queryset(self) -> QuerySet:
+        return Comment.objects.filter(post__in=Post.published_posts.all())
+
+
+class ProfileResource(Resource):
+    model = User
+    fields = {
+        'username': attribute('username'),
+        'first_name': attribute('first_name'),
+        'last_name': attribute('last_name'),
+        'date_joined': attribute('date_joined'),
+        'url': ApiField(
+            lambda user: reverse('blog:profile', args=(user.username,)),
+            only=('username',),
+        ),
+    }
+
+    def get_queryset(self) -> QuerySet:
+        return User.objects.filter(is_active=True)
@@ -0,0 +1,40 @@
+# Django Library
+from django.urls import path
+
+# Local Imports
+from . import views
+
+# Namespace - api.
+app_name = 'api'
+
+# List of JSON API addresses, version is a part of them.
+urlpatterns = [
+    path('v1/posts/', views.PostList.as_view(), name='post_list'),
+    path('v1/posts/<int:pk>/', views.PostDetail.as_view(), name='post'),
+    path(
+        'v1/posts/<int:pk>/comments/',
+        views.PostCommentList.as_view(),
+        name='post_comments',
+    ),
+    path(
+        'v1/comments/<int:pk>/',
+        views.CommentDetail.as_view(),
+        name='comment',
+    ),
+    path(
+        'v1/categories/',
+        views.CategoryList.as_view(),
+        name='category_list',
+    ),
+    path(
+        'v1/categories/<slug:slug>/',
+        views.CategoryDetail.as_view(),
+        name='category',
+    ),
+    path('v1/profiles/', views.ProfileList.as_view(), name='profile_list'),
+    path(
+        'v1/profiles/<slug:username>/',
+        views.ProfileDetail.as_view(),
+        name='profile',
+    ),
+]
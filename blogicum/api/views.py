@@ -0,0 +1,166 @@
+# Standart Library
+from typing import Any, Dict, Optional, TypeVar
+
+# Django Library
+from django.core.paginator import InvalidPage
+from django.db.models import QuerySet
+from django.http import Http404, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.views import View
+
+# Local Imports
+from .resources import (
+    ApiError,
+    CategoryResource,
+    CommentResource,
+    PostResource,
+    ProfileResource,
+    Resource,
+)
+from blog.models import Post
+from core.constants import API_MAX_PAGE_SIZE, API_PAGE_SIZE
+from core.paginators import CursorPaginator
+
+
+class ApiView(View):
+    '''
+    Read-only JSON view of API resource.
+    Errors are returned as {"detail": message} too.
+    '''
+    resource: Resource = None
+    http_method_names = ['get', 'head', 'options']
+
+    def dispatch(
+        self,
+        request: TypeVar('HttpRequest'),
+        *args: Any,
+        **kwargs: Any,
+    ) -> JsonResponse:
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        except Http404:
+            return JsonResponse({'detail': 'Не найдено.'}, status=404)
+        except ApiError as error:
+            return JsonResponse({'detail': error.detail}, status=error.status)
+
+    def get_queryset(self) -> QuerySet:
+        return self.resource.get_queryset()
+
+    def get_fields(self) -> list:
+        return self.resource.parse_fields(self.request.GET.get('fields'))
+
+
+class ListApiView(ApiView):
+    '''
+    Page of objects: {"results": [...], "next": url, "previous": url}.
+    Pages are keyset ones, addressed by opaque ?cursor=,
+    their size is set by ?limit=.
+    '''
+    def get(self, request, *args, **kwargs) -> JsonResponse:
+        fields = self.get_fields()
+        paginator = CursorPaginator(
+            self.resource.select(self.get_queryset(), fields),
+            self.get_limit(),
+            ordering=self.resource.ordering,
+        )
+        try:
+            page = paginator.page(request.GET.get('cursor'))
+        except InvalidPage:
+            raise ApiError('Неверный курсор.')
+        return JsonResponse({
+            'results': [self.resource.serialize(obj, fields) for obj in page],
+            'next': self.page_url(page.next_cursor),
+            'previous': self.page_url(page.previous_cursor),
+        })
+
+    def get_limit(self) -> int:
+        limit = self.request.GET.get('limit', '')
+        if not limit:
+            return API_PAGE_SIZE
+        if not limit.isdigit() or not 0 < int(limit) <= API_MAX_PAGE_SIZE:
+            raise ApiError(
+                f'limit должен быть от 1 до {API_MAX_PAGE_SIZE}.'
+            )
+        return int(limit)
+
+    def page_url(self, cursor: Optional[str]) -> Optional[str]:
+        if cursor is None:
+            return None
+        query = self.request.GET.copy()
+        query['cursor'] = cursor
+        return self.request.build_absolute_uri(
+            f'{self.request.path}?{query.urlencode()}'
+        )
+
+
+class DetailApiView(ApiView):
+    '''
+    Single object found by lookup_field equal to lookup_url_kwarg.
+    '''
+    lookup_field = 'pk'
+    lookup_url_kwarg = 'pk'
+
+    def get(self, request, *args, **kwargs) -> JsonResponse:
+        fields = self.get_fields()
+        obj = get_object_or_404(
+            self.resource.select(self.get_queryset(), fields),
+            **{self.lookup_field: kwargs[self.lookup_url_kwarg]},
+        )
+        return JsonResponse(self.resource.serialize(obj, fields))
+
+
+class CategoryList(ListApiView):
+    resource = CategoryResource()
+
+
+class CategoryDetail(DetailApiView):
+    resource = CategoryResource()
+    lookup_field = lookup_url_kwarg = 'slug'
+
+
+class PostList(ListApiView):
+    '''
+    Published posts, newest first.
+    Filtered by ?category=<slug> and ?author=<username>.
+    '''
+    resource = PostResource()
+
+    def get_queryset(self) -> QuerySet:
+        queryset = super().get_queryset()
+        filters: Dict[str, str] = {
+            'category__slug': self.request.GET.get('category'),
+            'author__username': self.request.GET.get('author'),
+        }
+        return queryset.filter(**{
+            lookup: value for lookup, value in filters.items() if value
+        })
+
+
+class PostDetail(DetailApiView):
+    resource = PostResource()
+
+
+class PostCommentList(ListApiView):
+    '''
+    Comments of published post, threads depth-first.
+    '''
+    resource = CommentResource()
+
+    def get_queryset(self) -> QuerySet:
+        post = get_object_or_404(
+            Post.published_posts.only('pk'), pk=self.kwargs['pk']
+        )
+        return super().get_queryset().filter(post=post)
+
+
+class CommentDetail(DetailApiView):
+    resource = CommentResource()
+
+
+class ProfileList(ListApiView):
+    resource = ProfileResource()
+
+
+class ProfileDetail(DetailApiView):
+    resource = ProfileResource()
+    lookup_field = lookup_url_kwarg = 'username'
@@ -3,6 +3,7 @@ from django.contrib import admin
 
 # Local Imports
 from .models import Category, Location, Post, Comment
+from .search import search_posts
 
 
 class PostInline(admin.StackedInline):
@@ -31,7 +32,7 @@ class PostAdmin(admin.ModelAdmin):
 
     Columns:
     --------
-    title -> clickable, searchable;
+    title -> clickable, searchable (full-text with text and comments);
     author -> informative;
     category -> for filtering, changeable via drop-down list;
     location -> for filtering;
@@ -63,6 +64,12 @@ class PostAdmin(admin.ModelAdmin):
     def location(self, obj):
         return obj.location
 
+    def get_search_results(self, request, queryset, search_term):
+        # Use full-text index instead of icontains scan over titles.
+        if not search_term.strip():
+            return queryset, False
+        return search_posts(queryset, search_term), False
+
 
 @admin.register(Category)
 class CategoryAdmin(admin.ModelAdmin):
@@ -117,5 +124,7 @@ class CommentAdmin(admin.ModelAdmin):
         'author',
     )
     exclude = ('post',)
+    # Path of the thread is built from parent once, on creation.
+    readonly_fields = ('parent',)
     list_display_links = ('text',)
     search_fields = ('author',)
@@ -6,3 +6,7 @@ class BlogConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'blog'
     verbose_name = 'Блог'
+
+    def ready(self):
+        # Register signal handlers.
+        from . import signals  # noqa: F401
@@ -0,0 +1,207 @@
+# Standart Library
+import hashlib
+from datetime import datetime
+from typing import Any, Optional, Tuple, TypeVar
+
+# Django Library
+from django.conf import settings
+from django.contrib.sites.shortcuts import get_current_site
+from django.contrib.syndication.views import Feed, add_domain
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.feedgenerator import Atom1Feed
+from django.utils.http import parse_http_date_safe
+
+# Local Imports
+from .models import Category, Post, User
+from core.cache import page_cache_key
+from core.constants import FEED_ITEMS, PAGE_CACHE_TIMEOUT, REPLICA_PIN_SECONDS
+from core.routers import read_from_replica
+
+# RSS and Atom feeds of published posts: all of them,
+# of a category and of an author.
+#
+# Feed documents are cached in 'pages' namespace like pages are,
+# so any change of posts (or their categories and authors)
+# makes them unreachable (see blog/signals.py).
+# Polling aggregators get 304 for cached document without queries.
+
+
+def full_name(user: User) -> str:
+    # get_full_name() is ' ' for users without names.
+    return user.get_full_name().strip() or user.username
+
+
+class CachedFeed(Feed):
+    """
+    Feed cached along with its validators.
+
+    ...
+
+    Strong ETag is hash of the document: the same cached bytes
+    are served until generation of 'pages' is bumped.
+    Documents are cached per scheme and host of the request.
+    Last-Modified is set by Feed from the newest item.
+    """
+    def __call__(
+        self,
+        request: TypeVar('HttpRequest'),
+        *args: Any,
+        **kwargs: Any,
+    ) -> HttpResponse:
+        # Links in the document are absolute for host and scheme.
+        key = page_cache_key('pages', request.build_absolute_uri(request.path))
+        cached = cache.get(key)
+        if cached is None:
+            response = super().__call__(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+            cached = (
+                response.content,
+                response['Content-Type'],
+                f'"{hashlib.md5(response.content).hexdigest()}"',
+                response.get('Last-Modified'),
+            )
+            # Feed read from lagging replica may miss latest posts.
+            from_replica = (read_from_replica.get()
+                            and settings.DATABASE_REPLICAS)
+            cache.set(key, cached, (REPLICA_PIN_SECONDS if from_replica
+                                    else PAGE_CACHE_TIMEOUT))
+        content, content_type, etag, last_modified = cached
+        response = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=parse_http_date_safe(last_modified or ''),
+        ) or HttpResponse(content, content_type=content_type)
+        response['ETag'] = etag
+        if last_modified:
+            response['Last-Modified'] = last_modified
+        patch_cache_control(response, no_cache=True, public=True)
+        return response
+
+
+class PostsFeed(CachedFeed):
+    """
+    RSS feed of all published posts, newest first.
+    """
+    title = 'Блогикум'
+    description = 'Новые публикации'
+
+    def link(self, obj: Optional[Any] = None) -> str:
+        return reverse('blog:index')
+
+    def subtitle(self, obj: Optional[Any] = None) -> str:
+        # Atom has subtitle instead of description.
+        return self._get_dynamic_attr('description', obj)
+
+    def get_posts(self, obj: Optional[Any]) -> TypeVar('QuerySet'):
+        return Post.published_posts.all()
+
+    def items(self, obj: Optional[Any] = None) -> TypeVar('QuerySet'):
+        return (self.get_posts(obj)
+                .select_related('author', 'category')
+                .order_by('-pub_date', '-pk')[:FEED_ITEMS])
+
+    def item_title(self, item: Post) -> str:
+        return item.title
+
+    def item_description(self, item: Post) -> str:
+        return item.text
+
+    def item_link(self, item: Post) -> str:
+        return reverse('blog:post_detail', args=(item.pk,))
+
+    def item_author_name(self, item: Post) -> str:
+        return full_name(item.author)
+
+    def item_author_link(self, item: Post) -> str:
+        return reverse('blog:profile', args=(item.author.username,))
+
+    def item_categories(self, item: Post) -> Tuple[str, ...]:
+        return (item.category.title,) if item.category else ()
+
+    def item_pubdate(self, item: Post) -> datetime:
+        return item.pub_date
+
+    def item_updateddate(self, item: Post) -> datetime:
+        return item.updated_at
+
+    def get_feed(self, obj: Optional[Any], request: TypeVar('HttpRequest')):
+        # Feed makes item links absolute, but not links of authors.
+        feed = super().get_feed(obj, request)
+        domain = get_current_site(request).domain
+        for item in feed.items:
+            if item['author_link']:
+                item['author_link'] = add_domain(
+                    domain,
+                    item['author_link'],
+                    request.is_secure(),
+                )
+        return feed
+
+
+class PostsAtomFeed(PostsFeed):
+    feed_type = Atom1Feed
+
+
+class CategoryFeed(PostsFeed):
+    """
+    RSS feed of published posts in published category.
+    """
+    def get_object(
+        self,
+        request: TypeVar('HttpRequest'),
+        category_slug: str,
+    ) -> Category:
+        return get_object_or_404(
+            Category,
+            slug=category_slug,
+            is_published=True,
+        )
+
+    def title(self, obj: Category) -> str:
+        return f'Блогикум: {obj.title}'
+
+    def description(self, obj: Category) -> str:
+        return obj.description
+
+    def link(self, obj: Category) -> str:
+        return reverse('blog:category_posts', args=(obj.slug,))
+
+    def get_posts(self, obj: Category) -> TypeVar('QuerySet'):
+        return obj.posts(manager='published_posts').all()
+
+
+class CategoryAtomFeed(CategoryFeed):
+    feed_type = Atom1Feed
+
+
+class AuthorFeed(PostsFeed):
+    """
+    RSS feed of published posts of the user.
+    """
+    def get_object(
+        self,
+        request: TypeVar('HttpRequest'),
+        username: str,
+    ) -> User:
+        return get_object_or_404(User, username=username)
+
+    def title(self, obj: User) -> str:
+        return f'Блогикум: {full_name(obj)}'
+
+    def description(self, obj: User) -> str:
+        return f'Публикации пользователя {obj.username}'
+
+    def link(self, obj: User) -> str:
+        return reverse('blog:profile', args=(obj.username,))
+
+    def get_posts(self, obj: User) -> TypeVar('QuerySet'):
+        return obj.posts(manager='published_posts').all()
+
+
+class AuthorAtomFeed(AuthorFeed):
+    feed_type = Atom1Feed
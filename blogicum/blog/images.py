@@ -0,0 +1,172 @@
+# Standart Library
+import os
+from datetime import timedelta
+from io import BytesIO
+from typing import Dict, Iterable, List
+
+# Django Library
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models import Q
+from django.utils import timezone
+
+# Third Party Library
+from PIL import Image, ImageOps
+
+# Local Imports
+from core.cache import bump_generation
+from core.constants import (
+    MEDIA_ORPHAN_GRACE,
+    POST_IMAGE_QUALITY,
+    POST_IMAGE_WIDTHS,
+)
+from core.jobs import enqueue, register_job
+
+# Processing of uploaded post images.
+#
+# Original is decoded, rotated by EXIF orientation and, if it has
+# EXIF (camera, GPS...), re-encoded without it under a new name.
+# For every width of POST_IMAGE_WIDTHS image is saved as JPEG and WebP
+# to variants/ subdirectory of post images and their names
+# are stored in Post.image_variants:
+# {'card': {'width': 640, 'jpeg': '...jpg', 'webp': '...webp'}, ...}
+#
+# All of it is done by background job (see core/jobs.py, runworker),
+# so requests don't wait for image decoding and encoding.
+# Until it's done templates show the original image.
+#
+# Storage deduplicates files (see core.storage.ContentAddressedStorage),
+# so a file is deleted only when no post refers to it anymore.
+FORMATS = {'jpeg': 'jpg', 'webp': 'webp'}
+# Quality of re-encoded originals.
+ORIGINAL_QUALITY = 95
+
+
+def load_image(name: str) -> Image.Image:
+    with default_storage.open(name) as file:
+        image = Image.open(file)
+        image.load()
+    return image
+
+
+def strip_exif(name: str, image: Image.Image) -> str:
+    # Save image without EXIF to post images, returns its name.
+    # Stored name is already sharded by storage, so only file name
+    # is kept, or storage would shard it once again.
+    content = BytesIO()
+    # Multi-picture JPEGs of some cameras are saved as plain JPEG.
+    image_format = ('JPEG' if image.format in (None, 'MPO')
+                    else image.format)
+    image.save(content, image_format, quality=ORIGINAL_QUALITY)
+    return default_storage.save(
+        os.path.join(settings.POST_IMAGES, os.path.basename(name)),
+        ContentFile(content.getvalue()),
+    )
+
+
+def make_variants(name: str, image: Image.Image) -> Dict[str, Dict]:
+    # Resize image stored under name into every width and format.
+    image = image.convert('RGB')
+    stem, _ = os.path.splitext(os.path.basename(name))
+    # Shared by all images, so identical variants are stored once.
+    directory = os.path.join(settings.POST_IMAGES, 'variants')
+    variants = {}
+    for variant, width in POST_IMAGE_WIDTHS.items():
+        width = min(width, image.width)
+        height = round(image.height * width / image.width)
+        resized = image.resize((width, height), Image.Resampling.LANCZOS)
+        variants[variant] = {'width': width}
+        for image_format, extension in FORMATS.items():
+            content = BytesIO()
+            resized.save(
+                content,
+                image_format.upper(),
+                quality=POST_IMAGE_QUALITY,
+                optimize=True,
+            )
+            variants[variant][image_format] = default_storage.save(
+                os.path.join(directory, f'{stem}_{variant}.{extension}'),
+                ContentFile(content.getvalue()),
+            )
+    return variants
+
+
+@register_job('blog.process_post_image')
+def process_post_image(post_pk: int) -> bool:
+    # Strip EXIF from post image, make its variants and store their names.
+    # Returns False if post is gone or its image has been replaced.
+    # Local Imports
+    from .models import Post
+
+    name, old_variants = (Post.objects.filter(pk=post_pk)
+                          .values_list('image', 'image_variants')
+                          .first() or ('', {}))
+    if not name:
+        return False
+    original = load_image(name)
+    # Pixels are rotated by EXIF orientation before it's dropped.
+    image = ImageOps.exif_transpose(original)
+    image.format = original.format
+    clean_name = strip_exif(name, image) if original.getexif() else name
+    variants = make_variants(clean_name, image)
+    # Image could be replaced meanwhile, then its own job is coming.
+    # updated_at makes cached post cards use the variants.
+    updated = Post.objects.filter(pk=post_pk, image=name).update(
+        image=clean_name,
+        image_variants=variants,
+        updated_at=timezone.now(),
+    )
+    if not updated:
+        release_files(image_files(clean_name, variants))
+        return False
+    # Original with EXIF must not stay around.
+    release_files([name], grace=0)
+    release_files(set(image_files('', old_variants))
+                  - set(image_files('', variants)))
+    bump_generation('pages')
+    return True
+
+
+def schedule_post_image(post_pk: int) -> None:
+    # Queued in the same transaction as the post itself.
+    enqueue('blog.process_post_image', post_pk=post_pk)
+
+
+def image_files(image: str, variants: Dict[str, Dict]) -> List[str]:
+    # Names of post image and all its variants.
+    names = [image] + [item[image_format]
+                       for item in (variants or {}).values()
+                       for image_format in FORMATS]
+    return [name for name in names if name]
+
+
+def is_referenced(name: str) -> bool:
+    # Local Imports
+    from .models import Post
+
+    return Post.objects.filter(
+        Q(image=name) | Q(image_variants__icontains=name)
+    ).exists()
+
+
+def is_recent(name: str, seconds: int) -> bool:
+    # File was saved or re-used within last seconds.
+    age = timezone.now() - default_storage.get_modified_time(name)
+    return age < timedelta(seconds=seconds)
+
+
+def release_files(
+    names: Iterable[str],
+    grace: int = MEDIA_ORPHAN_GRACE,
+) -> int:
+    # Delete files which no post refers to anymore.
+    # Recently saved or re-used ones are left to cleanup_media command.
+    deleted = 0
+    for name in set(names):
+        if (not default_storage.exists(name) or is_referenced(name)
+                or (grace and is_recent(name, grace))):
+            continue
+        default_storage.delete(name)
+        deleted += 1
+    return deleted
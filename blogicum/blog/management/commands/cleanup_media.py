@@ -0,0 +1,67 @@
+# Standart Library
+import os
+
+# Django Library
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+
+# Local Imports
+from blog.images import image_files, is_recent
+from blog.models import Post
+from core.constants import MEDIA_ORPHAN_GRACE
+
+
+class Command(BaseCommand):
+    """
+    Delete post image files no post refers to.
+
+    Files are released right away when posts are deleted or
+    their images replaced, this one catches the rest:
+    recently re-used files, failed uploads, bulk deletes.
+    Files younger than --grace seconds are kept.
+    """
+    help = 'Удаляет файлы иллюстраций, не связанные с публикациями.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--grace',
+            type=int,
+            default=MEDIA_ORPHAN_GRACE,
+            help='Keep files saved or re-used within these seconds.',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report what would be deleted.',
+        )
+
+    def handle(self, *args, **options):
+        referenced = set()
+        for image, variants in (Post.objects
+                                .exclude(image='')
+                                .values_list('image', 'image_variants')
+                                .iterator()):
+            referenced.update(image_files(image, variants))
+        deleted = freed = 0
+        for name in self._walk(settings.POST_IMAGES):
+            if (name in referenced
+                    or is_recent(name, options['grace'])):
+                continue
+            freed += default_storage.size(name)
+            deleted += 1
+            if not options['dry_run']:
+                default_storage.delete(name)
+        self.stdout.write(
+            f'{"Would delete" if options["dry_run"] else "Deleted"} '
+            f'{deleted} files, {freed / 2 ** 20:.1f} MiB'
+        )
+
+    def _walk(self, directory: str):
+        if not default_storage.exists(directory):
+            return
+        directories, files = default_storage.listdir(directory)
+        for name in files:
+            yield os.path.join(directory, name)
+        for name in directories:
+            yield from self._walk(os.path.join(directory, name))
@@ -0,0 +1,71 @@
+# Standart Library
+import json
+
+# Django Library
+from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+
+# Local Imports
+from blog.models import Post
+
+EXPORTED_FIELDS = (
+    'id',
+    'title',
+    'text',
+    'pub_date',
+    'is_published',
+    'author__username',
+    'category__slug',
+    'location__name',
+    'comments_count',
+)
+
+
+class Command(BaseCommand):
+    """
+    Export posts as JSON lines.
+
+    Rows are streamed with QuerySet.iterator(): on PostgreSQL
+    it reads them through server-side cursor chunk by chunk,
+    so memory use doesn't depend on number of posts.
+    """
+    help = 'Выгружает публикации в формате JSON Lines.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            help='File to write to, stdout by default.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=2000,
+            help='Rows fetched from database at once.',
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Include hidden and delayed posts.',
+        )
+
+    def handle(self, *args, **options):
+        manager = Post.objects if options['all'] else Post.published_posts
+        rows = (manager
+                .order_by('pk')
+                .values(*EXPORTED_FIELDS)
+                .iterator(chunk_size=options['chunk_size']))
+        output = (open(options['output'], 'w', encoding='utf-8')
+                  if options['output'] else self.stdout)
+        exported = 0
+        try:
+            for row in rows:
+                output.write(json.dumps(
+                    row,
+                    cls=DjangoJSONEncoder,
+                    ensure_ascii=False,
+                ) + '\n')
+                exported += 1
+        finally:
+            if options['output']:
+                output.close()
+        self.stderr.write(f'Exported {exported} posts')
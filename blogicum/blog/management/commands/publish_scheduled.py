@@ -0,0 +1,47 @@
+# Standart Library
+import time
+
+# Django Library
+from django.core.management.base import BaseCommand
+
+# Local Imports
+from blog.models import Post
+from blog.search import SEARCH_CACHE_NAMESPACE
+from core.cache import bump_generation
+
+
+class Command(BaseCommand):
+    """
+    Flip visible flag of delayed posts whose pub_date has come.
+
+    Also repairs flags which disagree with publication flags
+    (e.g. after bulk updates bypassing signals).
+    Run it from cron every minute, or keep it running with --loop.
+    """
+    help = 'Публикует отложенные публикации, время которых наступило.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep running and check posts every --interval seconds.',
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=60,
+            help='Seconds between checks in --loop mode.',
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            flipped = Post.objects.refresh_visibility()
+            if flipped:
+                # Queryset updates don't send signals.
+                bump_generation('posts')
+                bump_generation('pages')
+                bump_generation(SEARCH_CACHE_NAMESPACE)
+                self.stdout.write(f'Visibility changed for {flipped} posts')
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
@@ -0,0 +1,92 @@
+# Standart Library
+import time
+from datetime import datetime
+from typing import Optional
+
+# Django Library
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+# Local Imports
+from blog.models import Comment, Post
+from blog.search import (
+    index_posts,
+    indexed_until,
+    iter_documents,
+    remove_orphans,
+)
+
+
+class Command(BaseCommand):
+    """
+    Fill full-text search index in bulk.
+
+    Posts are streamed with QuerySet.iterator() in chunks,
+    comments of a chunk are fetched with one query and
+    index rows of a chunk are inserted with one executemany
+    in its own transaction.
+    Full rebuild replaces rows in place (search keeps working)
+    and then drops rows of missing posts.
+    Incremental one only indexes posts changed (updated_at)
+    after the latest indexed post or --since.
+    """
+    help = 'Перестраивает поисковый индекс публикаций.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Posts indexed in one transaction.',
+        )
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='Only posts changed after the latest indexed one.',
+        )
+        parser.add_argument(
+            '--since',
+            help='Only posts changed after this ISO datetime.',
+        )
+        parser.add_argument(
+            '--database',
+            default=DEFAULT_DB_ALIAS,
+            help='Database to rebuild index in.',
+        )
+
+    def handle(self, *args, **options):
+        using = options['database']
+        since = self._since(options, using)
+        posts = Post.objects.using(using)
+        if since is not None:
+            posts = posts.filter(updated_at__gt=since)
+        started = time.monotonic()
+        indexed = 0
+        for documents in iter_documents(
+            posts,
+            Comment.objects.using(using),
+            chunk_size=options['chunk_size'],
+        ):
+            with transaction.atomic(using=using):
+                indexed += index_posts(documents, using)
+            self.stderr.write(f'Indexed {indexed} posts')
+        removed = 0 if since is not None else remove_orphans(using)
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            f'Indexed {indexed} posts, removed {removed} '
+            f'in {elapsed:.2f}s ({indexed / max(elapsed, 1e-6):.0f} posts/s)'
+        )
+
+    def _since(self, options, using) -> Optional[datetime]:
+        if options['since']:
+            since = parse_datetime(options['since'])
+            if since is None:
+                raise CommandError(f'Invalid datetime: {options["since"]}')
+            if timezone.is_naive(since):
+                since = timezone.make_aware(since)
+            return since
+        if options['incremental']:
+            return indexed_until(using)
+        return None
@@ -0,0 +1,54 @@
+# Django Library
+from django.core.management.base import BaseCommand
+from django.db import models, transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+# Local Imports
+from blog.models import Comment, Post
+from core.cache import bump_generation
+
+
+class Command(BaseCommand):
+    """
+    Recompute denormalized Post.comments_count and repair drift.
+
+    Whole repair is done by a single UPDATE statement
+    touching only posts whose counter differs from real data.
+    """
+    help = 'Пересчитывает количество комментариев у публикаций.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report posts with wrong counters.',
+        )
+
+    def handle(self, *args, **options):
+        real_count = Coalesce(
+            Subquery(
+                Comment.objects
+                .filter(post=OuterRef('pk'))
+                .order_by()
+                .values('post')
+                .annotate(total=Count('pk'))
+                .values('total'),
+                output_field=models.PositiveIntegerField(),
+            ),
+            0,
+        )
+        drifted = Post.objects.exclude(comments_count=real_count)
+        if options['dry_run']:
+            self.stdout.write(
+                f'Posts with wrong comments count: {drifted.count()}'
+            )
+            return
+        with transaction.atomic():
+            repaired = drifted.update(comments_count=real_count)
+        if repaired:
+            # Cached pages show outdated counters.
+            bump_generation('pages')
+        self.stdout.write(self.style.SUCCESS(
+            f'Repaired comments count for {repaired} posts'
+        ))
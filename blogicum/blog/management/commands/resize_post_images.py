@@ -0,0 +1,35 @@
+# Django Library
+from django.core.management.base import BaseCommand
+
+# Local Imports
+from blog.images import process_post_image
+from blog.models import Post
+
+
+class Command(BaseCommand):
+    """
+    Make resized copies of post images which have none yet,
+    e.g. uploaded before variants were introduced.
+    Runs in the foreground, one image at a time,
+    the same job runworker does for new uploads.
+    """
+    help = 'Создаёт уменьшенные копии иллюстраций публикаций.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Remake variants of all images.',
+        )
+
+    def handle(self, *args, **options):
+        posts = Post.objects.exclude(image='')
+        if not options['all']:
+            posts = posts.filter(image_variants={})
+        processed = 0
+        for pk in posts.values_list('pk', flat=True).iterator():
+            try:
+                processed += process_post_image(pk)
+            except (OSError, ValueError) as error:
+                self.stderr.write(f'Post {pk}: {error}')
+        self.stdout.write(f'Resized images of {processed} posts')
@@ -0,0 +1,45 @@
+# Generated by Django 3.2.16 on 2026-10-17 07:07
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def fill_visible(apps, schema_editor):
+    Post = apps.get_model('blog', 'Post')
+    Post.objects.filter(
+        is_published=True,
+        category__is_published=True,
+        pub_date__lte=timezone.now(),
+    ).update(visible=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0011_post_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='post',
+            name='post_published_pub_date_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='post',
+            name='post_category_pub_date_idx',
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='visible',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Показывается на сайте'),
+        ),
+        migrations.RunPython(fill_visible, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('visible', True)), fields=['pub_date'], name='post_visible_pub_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('visible', True)), fields=['category', 'pub_date'], name='post_category_visible_idx'),
+        ),
+    ]
@@ -0,0 +1,87 @@
+import re
+
+from django.db import migrations
+
+import snowballstemmer
+
+# Frozen copy of blog.search at the time of this migration.
+SEARCH_TABLE = 'blog_post_search'
+SEARCH_CONFIG = 'russian'
+
+WORD_RE = re.compile(r'\w+')
+CYRILLIC_RE = re.compile(r'[а-я]')
+
+_russian = snowballstemmer.stemmer('russian')
+_english = snowballstemmer.stemmer('english')
+
+
+def stem_text(text):
+    words = WORD_RE.findall(text.lower().replace('ё', 'е'))
+    return ' '.join(
+        (_russian if CYRILLIC_RE.search(word) else _english).stemWord(word)
+        for word in words
+    )
+
+
+def create_search_index(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == 'sqlite':
+        schema_editor.execute(
+            f'CREATE VIRTUAL TABLE {SEARCH_TABLE} '
+            'USING fts5(title, text, comments, '
+            "tokenize = 'unicode61 remove_diacritics 2')"
+        )
+        sql = (f'INSERT INTO {SEARCH_TABLE} '
+               '(rowid, title, text, comments) VALUES (%s, %s, %s, %s)')
+    elif connection.vendor == 'postgresql':
+        schema_editor.execute(
+            f'CREATE TABLE {SEARCH_TABLE} ('
+            'post_id bigint PRIMARY KEY '
+            'REFERENCES blog_post (id) ON DELETE CASCADE '
+            'DEFERRABLE INITIALLY DEFERRED, '
+            'document tsvector NOT NULL)'
+        )
+        schema_editor.execute(
+            f'CREATE INDEX {SEARCH_TABLE}_document_idx '
+            f'ON {SEARCH_TABLE} USING GIN (document)'
+        )
+        sql = (f'INSERT INTO {SEARCH_TABLE} (post_id, document) VALUES ('
+               '%s, '
+               f"setweight(to_tsvector('{SEARCH_CONFIG}', %s), 'A') || "
+               f"setweight(to_tsvector('{SEARCH_CONFIG}', %s), 'B') || "
+               f"setweight(to_tsvector('{SEARCH_CONFIG}', %s), 'C'))")
+    else:
+        return
+    Post = apps.get_model('blog', 'Post')
+    Comment = apps.get_model('blog', 'Comment')
+    using = connection.alias
+    comments = {}
+    for post_id, text in (Comment.objects.using(using)
+                          .values_list('post_id', 'text')):
+        comments.setdefault(post_id, []).append(text)
+    rows = []
+    for pk, title, text in (Post.objects.using(using)
+                            .values_list('pk', 'title', 'text')):
+        texts = '\n'.join(comments.get(pk, ()))
+        if connection.vendor == 'sqlite':
+            title, text, texts = map(stem_text, (title, text, texts))
+        rows.append((pk, title, text, texts))
+    if rows:
+        with connection.cursor() as cursor:
+            cursor.executemany(sql, rows)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor in ('sqlite', 'postgresql'):
+        schema_editor.execute(f'DROP TABLE IF EXISTS {SEARCH_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0013_post_updated_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
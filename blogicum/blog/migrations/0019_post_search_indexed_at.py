@@ -0,0 +1,125 @@
+import re
+
+from django.db import migrations
+
+import snowballstemmer
+
+# Frozen copy of blog.search at the time of this migration:
+# index rows remember updated_at of their posts (indexed_at).
+SEARCH_TABLE = 'blog_post_search'
+SEARCH_CONFIG = 'russian'
+CHUNK_SIZE = 500
+
+WORD_RE = re.compile(r'\w+')
+CYRILLIC_RE = re.compile(r'[а-я]')
+
+_russian = snowballstemmer.stemmer('russian')
+_english = snowballstemmer.stemmer('english')
+
+
+def stem_text(text):
+    words = WORD_RE.findall(text.lower().replace('ё', 'е'))
+    return ' '.join(
+        (_russian if CYRILLIC_RE.search(word) else _english).stemWord(word)
+        for word in words
+    )
+
+
+def create_table(schema_editor, indexed_at):
+    connection = schema_editor.connection
+    schema_editor.execute(f'DROP TABLE IF EXISTS {SEARCH_TABLE}')
+    if connection.vendor == 'sqlite':
+        columns = 'title, text, comments'
+        if indexed_at:
+            columns += ', indexed_at UNINDEXED'
+        schema_editor.execute(
+            f'CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5({columns}, '
+            "tokenize = 'unicode61 remove_diacritics 2')"
+        )
+    else:
+        schema_editor.execute(
+            f'CREATE TABLE {SEARCH_TABLE} ('
+            'post_id bigint PRIMARY KEY '
+            'REFERENCES blog_post (id) ON DELETE CASCADE '
+            'DEFERRABLE INITIALLY DEFERRED, '
+            'document tsvector NOT NULL'
+            + (', indexed_at timestamp with time zone NOT NULL)'
+               if indexed_at else ')')
+        )
+        schema_editor.execute(
+            f'CREATE INDEX {SEARCH_TABLE}_document_idx '
+            f'ON {SEARCH_TABLE} USING GIN (document)'
+        )
+
+
+def fill_table(apps, schema_editor, indexed_at):
+    # Posts are streamed by chunks, comments of a chunk by one query.
+    connection = schema_editor.connection
+    if connection.vendor == 'sqlite':
+        sql = (f'INSERT INTO {SEARCH_TABLE} (rowid, title, text, comments'
+               + (', indexed_at) VALUES (%s, %s, %s, %s, %s)'
+                  if indexed_at else ') VALUES (%s, %s, %s, %s)'))
+    else:
+        sql = (f'INSERT INTO {SEARCH_TABLE} (post_id, document'
+               + (', indexed_at' if indexed_at else '') + ') VALUES (%s, '
+               f"setweight(to_tsvector('{SEARCH_CONFIG}', %s), 'A') || "
+               f"setweight(to_tsvector('{SEARCH_CONFIG}', %s), 'B') || "
+               f"setweight(to_tsvector('{SEARCH_CONFIG}', %s), 'C')"
+               + (', %s)' if indexed_at else ')'))
+    Post = apps.get_model('blog', 'Post')
+    Comment = apps.get_model('blog', 'Comment')
+    using = connection.alias
+
+    def write(chunk):
+        comments = {}
+        for post_id, text in (Comment.objects.using(using)
+                              .filter(post_id__in=[row[0] for row in chunk])
+                              .order_by('post_id', 'pk')
+                              .values_list('post_id', 'text')):
+            comments.setdefault(post_id, []).append(text)
+        rows = []
+        for pk, title, text, updated_at in chunk:
+            texts = '\n'.join(comments.get(pk, ()))
+            if connection.vendor == 'sqlite':
+                title, text, texts = map(stem_text, (title, text, texts))
+                updated_at = connection.ops.adapt_datetimefield_value(
+                    updated_at
+                )
+            row = (pk, title, text, texts)
+            rows.append(row + (updated_at,) if indexed_at else row)
+        with connection.cursor() as cursor:
+            cursor.executemany(sql, rows)
+
+    chunk = []
+    for row in (Post.objects.using(using).order_by('pk')
+                .values_list('pk', 'title', 'text', 'updated_at')
+                .iterator(chunk_size=CHUNK_SIZE)):
+        chunk.append(row)
+        if len(chunk) == CHUNK_SIZE:
+            write(chunk)
+            chunk = []
+    if chunk:
+        write(chunk)
+
+
+def add_indexed_at(apps, schema_editor):
+    if schema_editor.connection.vendor in ('sqlite', 'postgresql'):
+        create_table(schema_editor, indexed_at=True)
+        fill_table(apps, schema_editor, indexed_at=True)
+
+
+def remove_indexed_at(apps, schema_editor):
+    if schema_editor.connection.vendor in ('sqlite', 'postgresql'):
+        create_table(schema_editor, indexed_at=False)
+        fill_table(apps, schema_editor, indexed_at=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0018_comment_threads'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_indexed_at, remove_indexed_at),
+    ]
@@ -2,10 +2,16 @@
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.db.models import Q
 from django.utils import timezone
 
 # Local Imports
-from core.models import CreatedAtModel, PublishedModel, TitleModel
+from core.models import (
+    CreatedAtModel,
+    PublishedManager,
+    PublishedModel,
+    TitleModel,
+)
 
 User = get_user_model()
 User.add_to_class(
@@ -107,6 +113,12 @@ class Comment(CreatedAtModel):
     text: TextField
         text of comment itself
         further adjusted in its widget on the form
+    path: CharField
+        materialized path: zero-padded ids of thread root,
+        ancestors and comment itself joined by '/',
+        ordering by it lists threads depth-first
+    depth: PositiveSmallIntegerField
+        0 for top-level comments, at most COMMENT_MAX_DEPTH
     Overrides:
     ----------
         __str__ -> string
@@ -117,7 +129,12 @@ class Comment(CreatedAtModel):
         links to User db table as M:1
     post
         links to Post db table
+    parent
+        links to replied comment, None for top-level ones
     """
+    # Digits of every id in path, enough for 10 ** 10 comments.
+    PATH_DIGITS = 10
+
     text = models.TextField(verbose_name='Текст')
     author = models.ForeignKey(
         User,
@@ -131,15 +148,71 @@ class Comment(CreatedAtModel):
         related_name='comments',
         on_delete=models.CASCADE,
     )
+    parent = models.ForeignKey(
+        'self',
+        verbose_name='Ответ на',
+        null=True,
+        blank=True,
+        related_name='replies',
+        on_delete=models.CASCADE,
+    )
+    path = models.CharField(max_length=255, default='', editable=False)
+    depth = models.PositiveSmallIntegerField(default=0, editable=False)
 
     class Meta:
         ordering = ('created_at',)
         verbose_name = 'комментарий'
         verbose_name_plural = 'Комментарии'
+        # Page of top-level comments is selected by keyset on path,
+        # then their threads by one range query on path,
+        # see blog.views.CommentsPageMixin.
+        indexes = (
+            models.Index(
+                fields=('post', 'path'),
+                name='comment_post_path_idx',
+            ),
+            models.Index(
+                fields=('post', 'path'),
+                condition=Q(depth=0),
+                name='comment_post_thread_idx',
+            ),
+        )
 
     def __str__(self) -> str:
         return str(self.created_at)
 
+    def build_path(self) -> str:
+        # Needs pk, so it is set after insert (see blog/signals.py).
+        own = str(self.pk).zfill(self.PATH_DIGITS)
+        return f'{self.parent.path}/{own}' if self.parent_id else own
+
+
+class PostQuerySet(models.QuerySet):
+    """
+    Queryset with post-specific helpers shared by all Post managers.
+    """
+    def refresh_visibility(self) -> int:
+        # Bring materialized visible flag in line with
+        # publication flags and current time.
+        # Returns number of posts that were flipped.
+        now = timezone.now()
+        should_be_visible = Q(
+            is_published=True,
+            category__is_published=True,
+            pub_date__lte=now,
+        )
+        shown = (self.filter(should_be_visible, visible=False)
+                 .update(visible=True, updated_at=now))
+        hidden = (self.filter(visible=True)
+                  .exclude(should_be_visible)
+                  .update(visible=False, updated_at=now))
+        return shown + hidden
+
+    def touch(self) -> int:
+        # Mark posts as changed, e.g. when related objects shown
+        # on their cards are changed.
+        return self.update(updated_at=timezone.now())
+
 
 class Post(TitleModel, PublishedModel, CreatedAtModel):
     """
@@ -165,6 +238,20 @@ class Post(TitleModel, PublishedModel, CreatedAtModel):
         post itself
     pub_date: DateTimeField
         exact time of delayed publication
+    comments_count: PositiveIntegerField
+        denormalized number of comments,
+        kept in sync by signals in blog/signals.py
+    visible: BooleanField
+        materialized result of is_published_post,
+        recomputed on post and category changes
+        and by publish_scheduled command for delayed posts
+    image_variants: JSONField
+        names of resized JPEG and WebP copies of image
+        by variant (card, detail), made by blog/images.py
+    updated_at: DateTimeField
+        time of last change of post or data shown with it
+        (category, location, author), versions cached post cards,
+        drives incremental search index rebuild
     ForeignKeys:
     ------------
     author
@@ -185,6 +272,12 @@ class Post(TitleModel, PublishedModel, CreatedAtModel):
         blank=True,
         upload_to=settings.POST_IMAGES
     )
+    image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name='Уменьшенные копии иллюстрации',
+    )
     author = models.ForeignKey(
         User,
         verbose_name='Автор публикации',
@@ -206,19 +299,63 @@ class Post(TitleModel, PublishedModel, CreatedAtModel):
         null=True,
         related_name='posts',
     )
+    comments_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Количество комментариев',
+    )
+    visible = models.BooleanField(
+        default=False,
+        editable=False,
+        verbose_name='Показывается на сайте',
+    )
+    # Not auto_now: that one is left empty by raw saves of loaddata.
+    updated_at = models.DateTimeField(
+        default=timezone.now,
+        editable=False,
+        db_index=True,
+        verbose_name='Изменено',
+    )
+
+    # Both managers share PostQuerySet helpers.
+    objects = PostQuerySet.as_manager()
+    published_posts = PublishedManager.from_queryset(PostQuerySet)()
 
     class Meta:
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
+        # Indexes match filters and ordering of listings:
+        # feed, category page and author's profile.
+        # Boolean flag is a partial index condition rather than
+        # a leading column: SQLite can't use bare "WHERE visible"
+        # as an index equality, but matches it with index condition.
+        indexes = (
+            models.Index(
+                fields=('pub_date',),
+                condition=Q(visible=True),
+                name='post_visible_pub_date_idx',
+            ),
+            models.Index(
+                fields=('category', 'pub_date'),
+                condition=Q(visible=True),
+                name='post_category_visible_idx',
+            ),
+            models.Index(
+                fields=('author', 'pub_date'),
+                name='post_author_pub_date_idx',
+            ),
+        )
 
     @property
     def comment_count(self):
-        return Comment.objects.filter(post=self.pk).count()
+        # Denormalized counter, kept by blog/signals.py.
+        return self.comments_count
 
     @property
     def is_published_post(self):
         return (
             self.is_published
             and self.pub_date.astimezone() <= timezone.now()
+            and self.category is not None
             and self.category.is_published
         )
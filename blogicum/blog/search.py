@@ -0,0 +1,298 @@
+# Standart Library
+import re
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+# Django Library
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+# Third Party Library
+import snowballstemmer
+
+# Local Imports
+from core.cache import bump_generation
+from core.jobs import enqueue_once, register_job
+from core.paginators import CachedCountPaginator
+
+# Full-text index of posts: title, text and texts of all comments.
+#
+# SQLite: FTS5 virtual table, rowid is post id.
+# FTS5 has no Russian stemmer, so words are stemmed here
+# with the same Snowball algorithm PostgreSQL uses
+# and the table stores already stemmed text.
+#
+# PostgreSQL: plain table with weighted tsvector and GIN index,
+# stemming is done by 'russian' text search configuration.
+#
+# Every row remembers updated_at of the post it was built from
+# (indexed_at), so incremental rebuild picks up only newer posts.
+# The table is created by migrations 0014 and 0019.
+#
+# Index is kept in sync by signals (see blog/signals.py):
+# text of new comment is appended to the row of its post,
+# edited and deleted comments make the post reindexed in background,
+# as that takes all its comments.
+# Raw saves (loaddata) are not indexed, rebuild_search_index
+# command (re)fills it in bulk.
+#
+# Counts of search results are cached in their own namespace,
+# so changes of index keep cached counts of listings.
+SEARCH_TABLE = 'blog_post_search'
+SEARCH_CACHE_NAMESPACE = 'search'
+SEARCH_CONFIG = 'russian'
+# Relative weights of title, text and comments in ranking.
+SQLITE_WEIGHTS = (10.0, 4.0, 1.0)
+
+WORD_RE = re.compile(r'\w+')
+CYRILLIC_RE = re.compile(r'[а-я]')
+
+# pk, title, text, comments, updated_at
+PostDocument = Tuple[int, str, str, str, datetime]
+
+_russian = snowballstemmer.stemmer('russian')
+_english = snowballstemmer.stemmer('english')
+
+
+class SearchPaginator(CachedCountPaginator):
+    """
+    Paginator of search results with counts cached until index changes.
+    """
+    cache_namespace = SEARCH_CACHE_NAMESPACE
+
+
+def stem_words(text: str) -> List[str]:
+    # Lowercased stems of all words, ё is folded to е as Snowball expects.
+    # Latin words get English stems like in PostgreSQL 'russian' config.
+    words = WORD_RE.findall(text.lower().replace('ё', 'е'))
+    return [
+        (_russian if CYRILLIC_RE.search(word) else _english).stemWord(word)
+        for word in words
+    ]
+
+
+def stem_text(text: str) -> str:
+    return ' '.join(stem_words(text))
+
+
+def index_posts(
+    documents: Iterable[PostDocument],
+    using: str = 'default',
+) -> int:
+    # Insert or replace index rows of documents.
+    # One executemany per call, callers batch documents themselves.
+    connection = connections[using]
+    if connection.vendor == 'sqlite':
+        sql = (f'INSERT OR REPLACE INTO {SEARCH_TABLE} '
+               '(rowid, title, text, comments, indexed_at) '
+               'VALUES (%s, %s, %s, %s, %s)')
+        rows = [(pk, stem_text(title), stem_text(text), stem_text(comments),
+                 connection.ops.adapt_datetimefield_value(updated_at))
+                for pk, title, text, comments, updated_at in documents]
+    elif connection.vendor == 'postgresql':
+        sql = (f'INSERT INTO {SEARCH_TABLE} '
+               '(post_id, document, indexed_at) VALUES ('
+               '%s, '
+               f"setweight(to_tsvector('{SEARCH_CONFIG}', %s), 'A') || "
+               f"setweight(to_tsvector('{SEARCH_CONFIG}', %s), 'B') || "
+               f"setweight(to_tsvector('{SEARCH_CONFIG}', %s), 'C'), "
+               '%s) '
+               'ON CONFLICT (post_id) DO UPDATE '
+               'SET document = EXCLUDED.document, '
+               'indexed_at = EXCLUDED.indexed_at')
+        rows = list(documents)
+    else:
+        return 0
+    if rows:
+        with connection.cursor() as cursor:
+            cursor.executemany(sql, rows)
+        bump_generation(SEARCH_CACHE_NAMESPACE)
+    return len(rows)
+
+
+def remove_posts(pks: Iterable[int], using: str = 'default') -> None:
+    connection = connections[using]
+    column = {'sqlite': 'rowid', 'postgresql': 'post_id'}.get(
+        connection.vendor
+    )
+    pks = list(pks)
+    if column is None or not pks:
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {SEARCH_TABLE} WHERE {column} IN '
+            f'({", ".join(["%s"] * len(pks))})',
+            pks,
+        )
+    bump_generation(SEARCH_CACHE_NAMESPACE)
+
+
+def index_comment(
+    post_pk: int,
+    text: str,
+    using: str = 'default',
+) -> None:
+    # Add text of new comment to index row of its post,
+    # other comments are neither read nor stemmed again.
+    connection = connections[using]
+    if connection.vendor == 'sqlite':
+        sql = (f'UPDATE {SEARCH_TABLE} '
+               "SET comments = comments || ' ' || %s WHERE rowid = %s")
+        params = (stem_text(text), post_pk)
+    elif connection.vendor == 'postgresql':
+        sql = (f'UPDATE {SEARCH_TABLE} SET document = document || '
+               f"setweight(to_tsvector('{SEARCH_CONFIG}', %s), 'C') "
+               'WHERE post_id = %s')
+        params = (text, post_pk)
+    else:
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        updated = cursor.rowcount
+    if updated:
+        bump_generation(SEARCH_CACHE_NAMESPACE)
+
+
+def schedule_reindex(post_pk: int) -> None:
+    # Queued in the same transaction as the change,
+    # one job for any number of changes of the post.
+    enqueue_once('blog.reindex_post', post_pk=post_pk)
+
+
+@register_job('blog.reindex_post')
+def reindex_post(post_pk: int, using: str = 'default') -> None:
+    # Local Imports
+    from .models import Comment, Post
+
+    posts = Post.objects.using(using).filter(pk=post_pk)
+    if not posts.exists():
+        remove_posts([post_pk], using)
+        return
+    for documents in iter_documents(posts, Comment.objects.using(using)):
+        index_posts(documents, using)
+
+
+def iter_documents(
+    posts: QuerySet,
+    comments: QuerySet,
+    chunk_size: int = 500,
+) -> Iterator[List[PostDocument]]:
+    # Documents of posts in chunks of chunk_size.
+    # Posts are streamed with iterator(), comments of a chunk
+    # are fetched with one query, so it takes 1 + chunks queries.
+    rows = (posts.order_by('pk')
+            .values_list('pk', 'title', 'text', 'updated_at')
+            .iterator(chunk_size=chunk_size))
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield _with_comments(chunk, comments)
+            chunk = []
+    if chunk:
+        yield _with_comments(chunk, comments)
+
+
+def _with_comments(
+    chunk: List[Tuple[int, str, str, datetime]],
+    comments: QuerySet,
+) -> List[PostDocument]:
+    texts = {}
+    for post_id, text in (comments
+                          .filter(post_id__in=[row[0] for row in chunk])
+                          .order_by('post_id', 'pk')
+                          .values_list('post_id', 'text')):
+        texts.setdefault(post_id, []).append(text)
+    return [(pk, title, text, '\n'.join(texts.get(pk, ())), updated_at)
+            for pk, title, text, updated_at in chunk]
+
+
+def remove_orphans(using: str = 'default') -> int:
+    # Drop rows of posts which are not in database anymore,
+    # e.g. deleted with signals disconnected.
+    connection = connections[using]
+    column = {'sqlite': 'rowid', 'postgresql': 'post_id'}.get(
+        connection.vendor
+    )
+    if column is None:
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {SEARCH_TABLE} WHERE {column} NOT IN '
+            '(SELECT id FROM blog_post)'
+        )
+        removed = cursor.rowcount
+    if removed:
+        bump_generation(SEARCH_CACHE_NAMESPACE)
+    return removed
+
+
+def indexed_until(using: str = 'default') -> Optional[datetime]:
+    # updated_at of the latest post in index.
+    connection = connections[using]
+    if connection.vendor not in ('sqlite', 'postgresql'):
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT MAX(indexed_at) FROM {SEARCH_TABLE}')
+        value = cursor.fetchone()[0]
+    if isinstance(value, str):
+        # SQLite keeps naive UTC datetimes as text.
+        value = parse_datetime(value)
+        if timezone.is_naive(value):
+            value = timezone.make_aware(value, timezone.utc)
+    return value
+
+
+def match_expression(query: str) -> Optional[str]:
+    # FTS5 query of stemmed words joined by implicit AND.
+    # Every word is quoted, so user input can't use FTS5 syntax.
+    words = stem_words(query)
+    if not words:
+        return None
+    return ' '.join(f'"{word}"' for word in words)
+
+
+def search_posts(queryset: QuerySet, query: str) -> QuerySet:
+    """
+    Filter posts of queryset by full-text query, best matches first.
+
+    ...
+
+    Annotates posts with search_rank.
+    Query without words matches nothing.
+    """
+    vendor = connections[queryset.db].vendor
+    table = queryset.model._meta.db_table
+    if vendor == 'sqlite':
+        expression = match_expression(query)
+        if expression is None:
+            return queryset.none()
+        weights = ', '.join(str(weight) for weight in SQLITE_WEIGHTS)
+        # bm25() is negative, the lower the better.
+        return queryset.extra(
+            tables=[SEARCH_TABLE],
+            where=[f'{SEARCH_TABLE}.rowid = {table}.id',
+                   f'{SEARCH_TABLE} MATCH %s'],
+            params=[expression],
+            select={'search_rank': f'bm25({SEARCH_TABLE}, {weights})'},
+            order_by=['search_rank', '-pub_date'],
+        )
+    if vendor == 'postgresql':
+        if not stem_words(query):
+            return queryset.none()
+        tsquery = f"plainto_tsquery('{SEARCH_CONFIG}', %s)"
+        return queryset.extra(
+            tables=[SEARCH_TABLE],
+            where=[f'{SEARCH_TABLE}.post_id = {table}.id',
+                   f'{SEARCH_TABLE}.document @@ {tsquery}'],
+            params=[query],
+            select={'search_rank':
+                    f'ts_rank({SEARCH_TABLE}.document, {tsquery})'},
+            select_params=[query],
+            order_by=['-search_rank', '-pub_date'],
+        )
+    # No index for other databases, fall back to substring match.
+    return queryset.filter(Q(title__icontains=query)
+                           | Q(text__icontains=query))
@@ -0,0 +1,229 @@
+# Django Library
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import (
+    post_delete,
+    post_init,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+from django.utils import timezone
+
+# Local Imports
+from .images import image_files, release_files, schedule_post_image
+from .models import Category, Comment, Location, Post, User
+from .search import (
+    SEARCH_CACHE_NAMESPACE,
+    index_comment,
+    reindex_post,
+    remove_posts,
+    schedule_reindex,
+)
+from core.cache import bump_generation
+from core.constants import COMMENT_MAX_DEPTH
+
+
+# Materialize post visibility on every save.
+# Also for raw saves (loaddata), as long as category is already loaded.
+@receiver(pre_save, sender=Post)
+def compute_post_visibility(sender, instance, raw, **kwargs):
+    try:
+        instance.visible = instance.is_published_post
+    except Category.DoesNotExist:
+        instance.visible = False
+    if not raw:
+        instance.updated_at = timezone.now()
+
+
+# Post cards show category, location and author,
+# so their changes make cached cards of related posts outdated.
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Location)
+def touch_related_posts(sender, instance, raw, **kwargs):
+    if not raw:
+        instance.posts.touch()
+
+
+@receiver(post_save, sender=User)
+def touch_author_posts(sender, instance, raw, update_fields=None, **kwargs):
+    if not raw and (update_fields is None
+                    or set(update_fields) != {'last_login'}):
+        instance.posts.touch()
+
+
+# Category publication flag affects visibility of all its posts.
+@receiver(post_save, sender=Category)
+def refresh_category_posts_visibility(sender, instance, raw, **kwargs):
+    if not raw:
+        Post.objects.filter(category=instance).refresh_visibility()
+
+
+# Posts of deleted category lose it (SET_NULL) and become hidden.
+@receiver(pre_delete, sender=Category)
+def hide_category_posts(sender, instance, **kwargs):
+    instance.posts.update(visible=False)
+
+
+# Threads are limited to COMMENT_MAX_DEPTH levels:
+# replies to the deepest comments are added next to them.
+@receiver(pre_save, sender=Comment)
+def compute_comment_depth(sender, instance, raw, **kwargs):
+    if raw or not instance._state.adding:
+        return
+    parent = instance.parent
+    if parent is not None and parent.depth >= COMMENT_MAX_DEPTH:
+        instance.parent = parent = parent.parent
+    instance.depth = parent.depth + 1 if parent is not None else 0
+
+
+# Path includes comment's own id, so it is set right after insert.
+@receiver(post_save, sender=Comment)
+def set_comment_path(sender, instance, created, raw, **kwargs):
+    if created and not raw:
+        instance.path = instance.build_path()
+        Comment.objects.filter(pk=instance.pk).update(path=instance.path)
+
+
+# Keep Post.comments_count in sync with comments.
+# Single UPDATE with F() expression is atomic on db side,
+# so concurrent comments don't overwrite each other's counts.
+# Post is marked as changed by the same UPDATE: pages show its comments
+# and their count, and conditional GET compares updated_at of posts.
+# Raw saves (loaddata) are skipped, use recount_comments command after.
+@receiver(post_save, sender=Comment)
+def update_commented_post(sender, instance, created, raw, **kwargs):
+    if raw:
+        return
+    changes = {'updated_at': timezone.now()}
+    if created:
+        changes['comments_count'] = F('comments_count') + 1
+    Post.objects.filter(pk=instance.post_id).update(**changes)
+
+
+# Also fires for admin bulk deletes and cascades (user or post deletion).
+@receiver(post_delete, sender=Comment)
+def decrement_comments_count(sender, instance, **kwargs):
+    Post.objects.filter(pk=instance.post_id).update(
+        comments_count=Greatest(F('comments_count') - 1, 0),
+        updated_at=timezone.now(),
+    )
+
+
+# Cached paginator counts of posts and search results
+# become outdated when posts or their categories change.
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_post_counts(sender, **kwargs):
+    bump_generation('posts')
+    bump_generation(SEARCH_CACHE_NAMESPACE)
+
+
+# Pages cached for anonymous users show posts with their
+# categories, locations, authors and comment counts.
+# Bumping generation drops all of them at once.
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def invalidate_pages(sender, **kwargs):
+    bump_generation('pages')
+
+
+# Login only updates last_login, which is not shown anywhere.
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_pages(sender, update_fields=None, **kwargs):
+    if update_fields is None or set(update_fields) != {'last_login'}:
+        bump_generation('pages')
+
+
+# Full-text index covers post title, text and its comments.
+@receiver(post_save, sender=Post)
+def index_post(sender, instance, raw, using, **kwargs):
+    if not raw:
+        reindex_post(instance.pk, using)
+
+
+@receiver(post_delete, sender=Post)
+def unindex_post(sender, instance, using, **kwargs):
+    remove_posts([instance.pk], using)
+
+
+@receiver(post_save, sender=Comment)
+def index_post_comment(sender, instance, created, raw, using, **kwargs):
+    if raw:
+        return
+    if created:
+        index_comment(instance.post_id, instance.text, using)
+    else:
+        schedule_reindex(instance.post_id)
+
+
+@receiver(post_delete, sender=Comment)
+def unindex_post_comment(sender, instance, **kwargs):
+    schedule_reindex(instance.post_id)
+
+
+# Resized copies of post image are made in background when it changes.
+# Name of loaded image is remembered without loading deferred field,
+# None means it is unknown.
+# Files of replaced or deleted images are released after commit,
+# they are deleted if no other post uses them.
+def _image_name(instance):
+    if 'image' not in instance.__dict__:
+        return None
+    image = instance.__dict__['image']
+    return getattr(image, 'name', image) or ''
+
+
+def _image_changed(instance) -> bool:
+    loaded = instance._loaded_image
+    return loaded is not None and _image_name(instance) != loaded
+
+
+def _release_on_commit(names) -> None:
+    if names:
+        transaction.on_commit(lambda: release_files(names))
+
+
+@receiver(post_init, sender=Post)
+def remember_post_image(sender, instance, **kwargs):
+    instance._loaded_image = _image_name(instance)
+    instance._loaded_variants = instance.__dict__.get('image_variants')
+
+
+@receiver(pre_save, sender=Post)
+def reset_image_variants(sender, instance, **kwargs):
+    if _image_changed(instance):
+        instance._replaced_files = image_files(
+            instance._loaded_image,
+            instance._loaded_variants,
+        )
+        instance.image_variants = {}
+
+
+@receiver(post_save, sender=Post)
+def resize_post_image(sender, instance, created, raw, **kwargs):
+    if not raw and _image_name(instance) and (
+            created or _image_changed(instance)):
+        schedule_post_image(instance.pk)
+    _release_on_commit(instance.__dict__.pop('_replaced_files', None))
+    instance._loaded_image = _image_name(instance)
+    instance._loaded_variants = instance.__dict__.get('image_variants')
+
+
+@receiver(post_delete, sender=Post)
+def release_post_image(sender, instance, **kwargs):
+    _release_on_commit(image_files(
+        _image_name(instance) or '',
+        instance.__dict__.get('image_variants'),
+    ))
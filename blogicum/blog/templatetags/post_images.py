@@ -0,0 +1,47 @@
+# Standart Library
+from typing import Any, Dict
+
+# Django Library
+from django import template
+from django.core.files.storage import default_storage
+
+register = template.Library()
+
+# Widths of image on the page, for browser to choose variant from srcset.
+SIZES = {
+    'card': '(max-width: 40rem) 100vw, 40rem',
+    'detail': '(max-width: 40rem) 100vw, 40rem',
+}
+
+
+@register.inclusion_tag('includes/post_image.html')
+def post_image(post: Any, variant: str) -> Dict[str, Any]:
+    """
+    Render post image with resized variants in srcset.
+
+    ...
+
+    Falls back to the original image until variants are made
+    (see blog/images.py). Exactly one <img> is rendered.
+    """
+    variants = sorted(
+        (post.image_variants or {}).values(),
+        key=lambda item: item['width'],
+    )
+    context = {'post': post, 'variant': variant}
+    if variant not in (post.image_variants or {}):
+        return dict(context, src=post.image.url)
+
+    def srcset(image_format: str) -> str:
+        return ', '.join(
+            f'{default_storage.url(item[image_format])} {item["width"]}w'
+            for item in variants
+        )
+
+    return dict(
+        context,
+        src=default_storage.url(post.image_variants[variant]['jpeg']),
+        srcset=srcset('jpeg'),
+        webp_srcset=srcset('webp'),
+        sizes=SIZES.get(variant, '100vw'),
+    )
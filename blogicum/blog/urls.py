@@ -2,7 +2,7 @@
 from django.urls import path
 
 # Local Imports
-from . import views
+from . import feeds, views
 
 # Namespace - blog.
 app_name = 'blog'
@@ -40,6 +40,11 @@ urlpatterns = [
         name='edit_post',
     ),
     # Comments to post pages
+    path(
+        'posts/<int:pk>/comments/',
+        views.PostCommentsView.as_view(),
+        name='post_comments',
+    ),
     path(
         'posts/<int:pk>/comment/',
         views.AddComment.as_view(),
@@ -55,10 +60,35 @@ urlpatterns = [
         views.DeleteComment.as_view(),
         name='delete_comment',
     ),
+    # Full-text search
+    path('search/', views.PostSearchView.as_view(), name='search'),
     # Posts in category overview page
     path(
         'category/<slug:category_slug>/',
         views.CategoryView.as_view(),
         name='category_posts',
     ),
+    # RSS and Atom feeds
+    path('feeds/rss/', feeds.PostsFeed(), name='feed_rss'),
+    path('feeds/atom/', feeds.PostsAtomFeed(), name='feed_atom'),
+    path(
+        'category/<slug:category_slug>/rss/',
+        feeds.CategoryFeed(),
+        name='category_feed_rss',
+    ),
+    path(
+        'category/<slug:category_slug>/atom/',
+        feeds.CategoryAtomFeed(),
+        name='category_feed_atom',
+    ),
+    path(
+        'profile/<slug:username>/rss/',
+        feeds.AuthorFeed(),
+        name='profile_feed_rss',
+    ),
+    path(
+        'profile/<slug:username>/atom/',
+        feeds.AuthorAtomFeed(),
+        name='profile_feed_atom',
+    ),
 ]
@@ -1,11 +1,20 @@
 # Standart Library
-from typing import Any, Dict, TypeVar
+import hashlib
+from datetime import datetime
+from typing import Any, Dict, Optional, TypeVar
 
 # Django Library
+from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import Http404
+from django.core.cache import cache
+from django.core.paginator import InvalidPage
+from django.db import transaction
+from django.db.models import F, Max, Q, Subquery
+from django.http import Http404, HttpResponse, QueryDict
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse, reverse_lazy
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, parse_http_date_safe
 from django.views.generic import (
     CreateView,
     DeleteView,
@@ -18,13 +27,187 @@ from django.views.generic.list import MultipleObjectMixin
 # Local Imports
 from .forms import CommentForm, PostForm, UpdateUserForm
 from .models import Category, Comment, Post, User
-from core.constants import ITEMS_TO_SHOW
+from .search import SearchPaginator, search_posts
+from core.cache import get_generation, page_cache_key
+from core.constants import (
+    COMMENTS_TO_SHOW,
+    ITEMS_TO_SHOW,
+    PAGE_CACHE_TIMEOUT,
+    REPLICA_PIN_SECONDS,
+)
+from core.paginators import (
+    CachedCountPaginator,
+    CursorPage,
+    CursorPaginator,
+)
+from core.routers import read_from_replica
+
+
+# Headers of cached page kept along with its content.
+CACHED_HEADERS = ('ETag', 'Last-Modified', 'Cache-Control')
+
+
+class AnonymousPageCacheMixin:
+    '''
+    Cache whole rendered page for anonymous users.
+    Key includes generation of 'pages' namespace,
+    which is bumped on any change of shown data (see blog/signals.py).
+    Validators of the page are cached too,
+    so conditional requests are answered without queries.
+    Only query parameters the page depends on are part of the key,
+    so arbitrary query strings can't flood the cache.
+    '''
+    page_cache_namespace = 'pages'
+    page_cache_params = ('page', 'cursor')
+
+    def get_page_cache_path(self, request: TypeVar('HttpRequest')) -> str:
+        query = QueryDict(mutable=True)
+        for param in self.page_cache_params:
+            if param in request.GET:
+                query[param] = request.GET[param]
+        if not query:
+            return request.path
+        return f'{request.path}?{query.urlencode()}'
+
+    def dispatch(
+        self,
+        request: TypeVar('HttpRequest'),
+        *args: Any,
+        **kwargs: Any,
+    ) -> TypeVar('HttpResponse'):
+        if request.method != 'GET' or request.user.is_authenticated:
+            return super().dispatch(request, *args, **kwargs)
+        key = page_cache_key(
+            self.page_cache_namespace,
+            self.get_page_cache_path(request),
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            # Pages cached before validators were added have no headers.
+            content, content_type, *headers = cached
+            headers = headers[0] if headers else {}
+            response = get_conditional_response(
+                request,
+                etag=headers.get('ETag'),
+                last_modified=parse_http_date_safe(
+                    headers.get('Last-Modified', '')
+                ),
+            ) or HttpResponse(content, content_type=content_type)
+            for header, value in headers.items():
+                response[header] = value
+            return response
+        response = super().dispatch(request, *args, **kwargs)
+        if (response.status_code == 200
+                and hasattr(response, 'add_post_render_callback')):
+            # Page read from lagging replica may miss latest changes,
+            # keep it no longer than clients are pinned to primary.
+            from_replica = (read_from_replica.get()
+                            and settings.DATABASE_REPLICAS)
+            timeout = (REPLICA_PIN_SECONDS if from_replica
+                       else PAGE_CACHE_TIMEOUT)
+            response.add_post_render_callback(lambda rendered: cache.set(
+                key,
+                (rendered.content, rendered['Content-Type'], {
+                    header: rendered[header] for header in CACHED_HEADERS
+                    if rendered.has_header(header)
+                }),
+                timeout,
+            ))
+        return response
+
+
+class ConditionalPageMixin:
+    '''
+    Answer conditional GET with 304 before the page is rendered.
+    Last-Modified is the newest updated_at of posts shown on the page,
+    found by one aggregate query: comments, authors, categories
+    and locations mark their posts as changed (see blog/signals.py).
+    Weak ETag adds generation of 'pages' namespace, bumped on any
+    change including deletions, and the user, since pages differ
+    for anonymous and every authenticated user.
+    Pages of authenticated users have forms with CSRF token
+    of the session, so the session is a part of ETag too:
+    page kept by browser from previous login is not reused.
+    Browsers are told to revalidate pages every time.
+    '''
+    def get_modified_posts(self) -> TypeVar('QuerySet'):
+        return Post.objects.all()
+
+    def get_last_modified(self) -> Optional[datetime]:
+        return (self.get_modified_posts()
+                .aggregate(Max('updated_at'))['updated_at__max'])
+
+    def dispatch(
+        self,
+        request: TypeVar('HttpRequest'),
+        *args: Any,
+        **kwargs: Any,
+    ) -> TypeVar('HttpResponse'):
+        if request.method not in ('GET', 'HEAD'):
+            return super().dispatch(request, *args, **kwargs)
+        last_modified = self.get_last_modified()
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        session = (request.session.session_key
+                   if request.user.is_authenticated else '')
+        version = (f'{get_generation("pages")}:{request.user.pk or 0}:'
+                   f'{session}:{timestamp}')
+        etag = f'W/"{hashlib.md5(version.encode()).hexdigest()}"'
+        response = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=timestamp,
+        )
+        if response is None:
+            response = super().dispatch(request, *args, **kwargs)
+        if response.status_code not in (200, 304):
+            return response
+        response['ETag'] = etag
+        if timestamp is not None:
+            response['Last-Modified'] = http_date(timestamp)
+        if request.user.is_authenticated:
+            patch_cache_control(response, no_cache=True, private=True)
+        else:
+            patch_cache_control(response, no_cache=True)
+        return response
+
+
+class PostPaginationMixin:
+    '''
+    Paginate post listings with cached total counts.
+    Switch to keyset pagination
+    when settings.POSTS_CURSOR_PAGINATION is on.
+    Pages are addressed by opaque ?cursor= tokens instead of ?page=.
+    '''
+    paginator_class = CachedCountPaginator
+
+    def paginate_queryset(
+        self,
+        queryset: TypeVar('QuerySet'),
+        page_size: int,
+    ) -> tuple:
+        if not settings.POSTS_CURSOR_PAGINATION:
+            return super().paginate_queryset(queryset, page_size)
+        paginator = CursorPaginator(
+            queryset,
+            page_size,
+            ordering=('-pub_date', '-pk'),
+        )
+        try:
+            page = paginator.page(self.request.GET.get('cursor'))
+        except InvalidPage as error:
+            raise Http404(str(error))
+        return paginator, page, page.object_list, page.has_other_pages()
 
 
 # ******************
 # Post related views
 # ******************
-class PostListView(ListView):
+class PostListView(
+    AnonymousPageCacheMixin,
+    ConditionalPageMixin,
+    PostPaginationMixin,
+    ListView,
+):
     """
     Generate list of published posts for the homepage.
     """
@@ -39,38 +222,158 @@ class PostListView(ListView):
     template_name = 'blog/index.html'
 
 
-class PostDetailView(DetailView):
+class PostSearchView(ListView):
     '''
-    Show post in all its details (comments included).
+    Full-text search through published posts and their comments.
+    Best matches go first, so pages are numbered even
+    when keyset pagination is on for other listings.
     '''
     model = Post
-    template_name = 'blog/detail.html'
-
-    def dispatch(
-        self,
-        request: TypeVar('HttpRequest'),
-        *args: Any,
-        **kwargs: Any
-    ) -> TypeVar('HttpResponse'):
-        get_object_or_404(
-            Post.objects.select_related(
-                "author",
-                "location",
-                "category",
+    paginator_class = SearchPaginator
+    paginate_by = ITEMS_TO_SHOW
+    template_name = 'blog/search.html'
+
+    def get_queryset(self) -> TypeVar('QuerySet'):
+        self.search_query = self.request.GET.get('q', '').strip()
+        if not self.search_query:
+            return Post.objects.none()
+        return search_posts(
+            Post.published_posts.select_related(
+                'author',
+                'location',
+                'category',
             ),
-            pk=self.kwargs['pk'],
+            self.search_query,
+        )
+
+    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
+        return dict(
+            **super().get_context_data(**kwargs),
+            search_query=self.search_query,
         )
-        if (self.get_object().author != request.user
-                and not self.get_object().is_published_post):
+
+
+class VisiblePostMixin:
+    '''
+    Post visible to current user: published one or their own.
+    Post is fetched once with its relations
+    and reused for visibility check, rendering and comments.
+    '''
+    model = Post
+    queryset = Post.objects.select_related(
+        'author',
+        'location',
+        'category',
+    )
+
+    def get_object(self, queryset=None) -> Post:
+        post = super().get_object(queryset)
+        if (post.author_id != self.request.user.id
+                and not post.is_published_post):
             raise Http404
-        return super().dispatch(request, *args, **kwargs)
+        return post
+
+
+class CommentsPageMixin:
+    '''
+    Comment threads of the post by pages, oldest first.
+    Page is a range of paths from its first top-level comment
+    up to the first top-level comment of the next page
+    (found by subquery), so whole threads are fetched depth-first
+    by one indexed query however many comments there are.
+    Next page is addressed by ?cursor= of the previous one.
+    '''
+    comments_per_page = COMMENTS_TO_SHOW
+
+    def get_comments_page(self) -> CursorPage:
+        comments = self.object.comments
+        threads = CursorPaginator(
+            comments.filter(depth=0),
+            self.comments_per_page,
+            ordering=('path',),
+        )
+        cursor = self.request.GET.get('cursor')
+        if cursor:
+            try:
+                direction, (after,) = threads.decode_cursor(cursor)
+            except InvalidPage as error:
+                raise Http404(str(error))
+            if direction != 'n':
+                raise Http404('Invalid cursor')
+            # Replies of the last thread of the previous page
+            # are shown there already.
+            comments = comments.filter(
+                Q(path__gt=after) & ~Q(path__startswith=f'{after}/')
+            )
+            threads.queryset = threads.queryset.filter(path__gt=after)
+        next_thread = Subquery(
+            threads.queryset.order_by('path').values('path')[
+                self.comments_per_page:self.comments_per_page + 1
+            ]
+        )
+        items = list(
+            comments
+            .select_related('author')
+            .annotate(next_thread=next_thread)
+            # Last page has no next thread, so all the rest fits.
+            .filter(Q(path__lt=F('next_thread'))
+                    | Q(next_thread__isnull=True))
+            .order_by('path')
+        )
+        last_thread = next(
+            (item for item in reversed(items) if not item.depth), None
+        )
+        return CursorPage(
+            items,
+            threads,
+            next_cursor=(threads.encode_cursor('n', last_thread)
+                         if items and items[0].next_thread else None),
+        )
+
+
+class PostDetailView(
+    ConditionalPageMixin,
+    VisiblePostMixin,
+    CommentsPageMixin,
+    DetailView,
+):
+    '''
+    Show post in all its details with the first page of comments.
+    Comment to reply to is chosen by ?reply_to=.
+    '''
+    template_name = 'blog/detail.html'
+
+    def get_last_modified(self) -> datetime:
+        # Post is needed anyway, so it is fetched once for both.
+        self.object = self.get_object()
+        return self.object.updated_at
+
+    def get(self, request, *args, **kwargs) -> TypeVar('HttpResponse'):
+        context = self.get_context_data(object=self.object)
+        return self.render_to_response(context)
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        reply_to = self.request.GET.get('reply_to', '')
         return dict(
             **super().get_context_data(**kwargs),
-            comments=(Comment.objects.filter(post__id=self.get_object().pk)
-                      .select_related('author').order_by('created_at')),
+            comments=self.get_comments_page(),
             form=CommentForm(),
+            reply_to=(self.object.comments.select_related('author')
+                      .filter(pk=reply_to).first()
+                      if reply_to.isdigit() else None),
+        )
+
+
+class PostCommentsView(VisiblePostMixin, CommentsPageMixin, DetailView):
+    '''
+    Next page of post's comments as HTML fragment for "load more".
+    '''
+    template_name = 'includes/comment_list.html'
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        return dict(
+            **super().get_context_data(**kwargs),
+            comments=self.get_comments_page(),
         )
 
 
@@ -198,7 +501,18 @@ class AddComment(CommentMixin, LoginRequiredMixin, CreateView):
     ) -> TypeVar('HttpResponse'):
         form.instance.author = self.request.user
         form.instance.post = self.commented_post
-        return super().form_valid(form)
+        parent = self.request.POST.get('parent')
+        if parent:
+            if not parent.isdigit():
+                raise Http404
+            form.instance.parent = get_object_or_404(
+                Comment,
+                pk=parent,
+                post=self.commented_post,
+            )
+        # Comment and post's comments counter are saved together.
+        with transaction.atomic():
+            return super().form_valid(form)
 
 
 class EditComment(CommentMixin, LoginRequiredMixin, UpdateView):
@@ -255,11 +569,27 @@ class DeleteComment(CommentMixin, LoginRequiredMixin, DeleteView):
         )
         return super().dispatch(request, *args, **kwargs)
 
+    def delete(
+        self,
+        request: TypeVar('HttpRequest'),
+        *args: Any,
+        **kwargs: Any,
+    ) -> TypeVar('HttpResponse'):
+        # Comment and post's comments counter are removed together.
+        with transaction.atomic():
+            return super().delete(request, *args, **kwargs)
+
 
 # **********************
 # Category related views
 # **********************
-class CategoryView(DetailView, MultipleObjectMixin):
+class CategoryView(
+    AnonymousPageCacheMixin,
+    ConditionalPageMixin,
+    PostPaginationMixin,
+    DetailView,
+    MultipleObjectMixin,
+):
     '''
     List of all posts (published) under the category.
     '''
@@ -268,6 +598,9 @@ class CategoryView(DetailView, MultipleObjectMixin):
     paginate_by = ITEMS_TO_SHOW
     template_name = 'blog/category.html'
 
+    def get_modified_posts(self) -> TypeVar('QuerySet'):
+        return Post.objects.filter(category__slug=self.kwargs['category_slug'])
+
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         category = get_object_or_404(
             Category,
@@ -276,6 +609,7 @@ class CategoryView(DetailView, MultipleObjectMixin):
         )
         object_list = (category
                        .posts(manager='published_posts')
+                       .select_related('author', 'location', 'category')
                        .order_by('-pub_date'))
         context = super().get_context_data(object_list=object_list, **kwargs)
         context['category'] = category
@@ -285,7 +619,13 @@ class CategoryView(DetailView, MultipleObjectMixin):
 # ******************
 # User related views
 # ******************
-class ShowUserProfile(DetailView, MultipleObjectMixin):
+class ShowUserProfile(
+    AnonymousPageCacheMixin,
+    ConditionalPageMixin,
+    PostPaginationMixin,
+    DetailView,
+    MultipleObjectMixin,
+):
     '''
     Access to public data on user including all his (published) posts.
     Author can see theirs post even if they unpublished.
@@ -296,6 +636,9 @@ class ShowUserProfile(DetailView, MultipleObjectMixin):
     slug_url_kwarg = 'username'
     template_name = 'blog/profile.html'
 
+    def get_modified_posts(self) -> TypeVar('QuerySet'):
+        return Post.objects.filter(author__username=self.kwargs['username'])
+
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         profile = get_object_or_404(
             User,
@@ -306,6 +649,7 @@ class ShowUserProfile(DetailView, MultipleObjectMixin):
         else:
             manager = 'objects'
         object_list = (profile.posts(manager=manager)
+                       .select_related('author', 'location', 'category')
                        .order_by('-pub_date'))
         context = super().get_context_data(object_list=object_list, **kwargs)
         context['profile'] = profile
@@ -0,0 +1,17 @@
+# Settings profile is chosen by BLOGICUM_PROFILE environment variable:
+# dev (default), prod or bench.
+# Profile module can also be set directly, e.g.
+# DJANGO_SETTINGS_MODULE=blogicum.settings.prod
+# Standart Library
+import os
+
+PROFILE = os.environ.get('BLOGICUM_PROFILE', 'dev')
+
+if PROFILE == 'prod':
+    from .prod import *  # noqa: F401, F403
+elif PROFILE == 'bench':
+    from .bench import *  # noqa: F401, F403
+elif PROFILE == 'dev':
+    from .dev import *  # noqa: F401, F403
+else:
+    raise ValueError(f'Unknown settings profile: {PROFILE}')
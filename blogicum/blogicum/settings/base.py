@@ -0,0 +1,222 @@
+# Settings common for all profiles.
+# Standart Library
+import os
+from pathlib import Path
+
+# Build paths inside the project like this: BASE_DIR / 'subdir'.
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+
+SECRET_KEY = os.environ.get(
+    'BLOGICUM_SECRET_KEY',
+    'django-insecure-z2h*mts@h6b@0w)b9xz5qe5$7p)#^ctfw7u@b)ipyad(c9n$&t',
+)
+
+DEBUG = False
+
+ALLOWED_HOSTS = [
+    'localhost',
+    '127.0.0.1',
+]
+
+
+INSTALLED_APPS = [
+    'django.contrib.admin',
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+    'django.contrib.staticfiles',
+    'blog.apps.BlogConfig',
+    'pages.apps.PagesConfig',
+    'core.apps.CoreConfig',
+    'api.apps.ApiConfig',
+    'django_bootstrap5',
+]
+
+MIDDLEWARE = [
+    'core.middleware.ReplicaRoutingMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+ROOT_URLCONF = 'blogicum.urls'
+
+TEMPLATES_DIR = BASE_DIR / 'templates'
+
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [TEMPLATES_DIR],
+        'APP_DIRS': True,
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.debug',
+                'django.template.context_processors.request',
+                'django.contrib.auth.context_processors.auth',
+                'django.contrib.messages.context_processors.messages',
+            ],
+        },
+    },
+]
+
+# Parse all templates from TEMPLATES_DIR on startup,
+# makes sense only with cached template loader.
+TEMPLATES_PREWARM = False
+
+WSGI_APPLICATION = 'blogicum.wsgi.application'
+
+
+# Database
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ.get('BLOGICUM_DB_NAME', BASE_DIR / 'db.sqlite3'),
+        'OPTIONS': {
+            # Seconds to wait for a lock before "database is locked".
+            'timeout': 20,
+        },
+    }
+}
+
+# PostgreSQL is used when BLOGICUM_DB_ENGINE=postgresql.
+# Connections are kept open by CONN_MAX_AGE (see prod profile);
+# for pooling across processes put PgBouncer in front of the server
+# and set BLOGICUM_DB_PGBOUNCER=1: transaction pooling
+# doesn't support server-side cursors.
+if os.environ.get('BLOGICUM_DB_ENGINE') == 'postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('BLOGICUM_DB_NAME', 'blogicum'),
+            'USER': os.environ.get('BLOGICUM_DB_USER', 'blogicum'),
+            'PASSWORD': os.environ.get('BLOGICUM_DB_PASSWORD', ''),
+            'HOST': os.environ.get('BLOGICUM_DB_HOST', 'localhost'),
+            'PORT': os.environ.get('BLOGICUM_DB_PORT', '5432'),
+            'DISABLE_SERVER_SIDE_CURSORS': bool(
+                os.environ.get('BLOGICUM_DB_PGBOUNCER')
+            ),
+        }
+    }
+
+# Read replicas: comma-separated BLOGICUM_DB_REPLICAS with file names
+# for SQLite or host names for PostgreSQL, other parameters are taken
+# from default database. Read-only requests are routed to them
+# by core.routers.PrimaryReplicaRouter.
+DATABASE_REPLICAS = []
+
+for number, replica in enumerate(
+    filter(None, os.environ.get('BLOGICUM_DB_REPLICAS', '').split(',')),
+    start=1,
+):
+    DATABASES[f'replica{number}'] = {
+        **DATABASES['default'],
+        ('HOST' if 'postgresql' in DATABASES['default']['ENGINE']
+         else 'NAME'): replica,
+        # Tests use primary test database for replicas too.
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(f'replica{number}')
+
+DATABASE_ROUTERS = ['core.routers.PrimaryReplicaRouter']
+
+# Applied to every new SQLite connection (see core/signals.py).
+# WAL lets readers work alongside a writer, NORMAL sync is safe with WAL
+# and saves fsync per commit, busy_timeout (ms) makes writers wait
+# for each other instead of failing.
+SQLITE_PRAGMAS = {
+    'journal_mode': 'wal',
+    'synchronous': 'normal',
+    'busy_timeout': 20000,
+    'mmap_size': 256 * 1024 * 1024,
+    # Negative value is size in KiB.
+    'cache_size': -64 * 1024,
+    'temp_store': 'memory',
+}
+
+
+# Cache
+# Local memory cache is per process: with several workers use
+# 'django.core.cache.backends.filebased.FileBasedCache'
+# with LOCATION on shared disk, so invalidation reaches all of them.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'blogicum',
+    }
+}
+
+
+# Password validation
+AUTH_PASSWORD_VALIDATORS = [
+    {
+        'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator',
+    },
+]
+
+
+# Internationalization
+LANGUAGE_CODE = 'ru-RU'
+
+TIME_ZONE = 'UTC'
+
+USE_I18N = True
+
+USE_L10N = True
+
+USE_TZ = True
+
+
+# Static files (CSS, JavaScript, Images)
+STATIC_URL = 'static/'
+
+STATICFILES_DIRS = [
+    BASE_DIR / 'static',
+]
+
+# Default primary key field type
+DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+CSRF_FAILURE_VIEW = 'pages.views.permission_denied'
+
+MEDIA_ROOT = BASE_DIR / 'media'
+
+MEDIA_URL = 'media/'
+
+LOGIN_REDIRECT_URL = 'blog:index'
+
+
+# Email
+EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
+
+EMAIL_FILE_PATH = BASE_DIR / 'sent_emails'
+
+POST_IMAGES = 'post_images'
+# Uploads are named by hash of content, identical ones are stored once.
+DEFAULT_FILE_STORAGE = 'core.storage.ContentAddressedStorage'
+# How serve_media view (core/views.py) sends files: 'django' streams
+# them itself, 'x-accel-redirect' (nginx) and 'x-sendfile' (Apache,
+# lighttpd) hand them off to web server.
+MEDIA_SERVE_MODE = os.environ.get('BLOGICUM_MEDIA_SERVE_MODE', 'django')
+# nginx internal location with alias to MEDIA_ROOT, for 'x-accel-redirect'.
+MEDIA_ACCEL_PREFIX = '/protected-media/'
+
+
+# Pagination
+# Use keyset pagination (?cursor=) for post listings
+# instead of numbered pages (?page=).
+POSTS_CURSOR_PAGINATION = False
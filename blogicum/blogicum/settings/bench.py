@@ -0,0 +1,21 @@
+# Benchmark settings: production profile runnable locally
+# without collectstatic and with cache in memory.
+# Local Imports
+from .prod import *  # noqa: F401, F403
+
+ALLOWED_HOSTS = [
+    'localhost',
+    '127.0.0.1',
+    'testserver',
+]
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'blogicum',
+    }
+}
+
+STATICFILES_STORAGE = (
+    'django.contrib.staticfiles.storage.StaticFilesStorage'
+)
@@ -0,0 +1,20 @@
+# Development settings: debug mode and debug toolbar.
+# Local Imports
+from .base import *  # noqa: F401, F403
+from .base import INSTALLED_APPS, MIDDLEWARE
+
+DEBUG = True
+
+INSTALLED_APPS = [
+    *INSTALLED_APPS,
+    'debug_toolbar',
+]
+
+MIDDLEWARE = [
+    'debug_toolbar.middleware.DebugToolbarMiddleware',
+    *MIDDLEWARE,
+]
+
+INTERNAL_IPS = [
+    '127.0.0.1',
+]
@@ -0,0 +1,70 @@
+# Production settings: no debug tools and less work per request.
+# Standart Library
+import os
+from copy import deepcopy
+
+# Local Imports
+from . import base
+from .base import *  # noqa: F401, F403
+from .base import BASE_DIR, TEMPLATES_DIR
+
+DEBUG = False
+
+ALLOWED_HOSTS = os.environ.get(
+    'BLOGICUM_ALLOWED_HOSTS',
+    'localhost,127.0.0.1',
+).split(',')
+
+# Keep database connections open between requests.
+# Copy, so other profiles imported in the same process keep theirs.
+# Replicas are included, their aliases are built by base already.
+DATABASES = deepcopy(base.DATABASES)
+for database in DATABASES.values():
+    database['CONN_MAX_AGE'] = 60
+
+# Templates are read and parsed once per process by cached loader
+# and pre-warmed on startup (see core.apps.CoreConfig.ready).
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [TEMPLATES_DIR],
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.debug',
+                'django.template.context_processors.request',
+                'django.contrib.auth.context_processors.auth',
+                'django.contrib.messages.context_processors.messages',
+            ],
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
+        },
+    },
+]
+
+TEMPLATES_PREWARM = True
+
+# Cache on disk is shared by all worker processes,
+# so invalidation in one of them is seen by others.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get(
+            'BLOGICUM_CACHE_DIR',
+            BASE_DIR / 'cache',
+        ),
+    }
+}
+
+# Sessions are read from cache and written through to db.
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
+# Hashed names allow far-future caching of static files,
+# .gz copies are served by web server as is (nginx gzip_static).
+# Run collectstatic on deploy.
+STATIC_ROOT = BASE_DIR / 'static_root'
+
+STATICFILES_STORAGE = 'core.storage.CompressedManifestStaticFilesStorage'
@@ -2,10 +2,10 @@
 from django.conf import settings
 from django.contrib import admin
 from django.urls import include, path, reverse_lazy
-from django.conf.urls.static import static
 from django.views.generic import CreateView
 
 from blog.forms import UserCreateForm
+from core.views import serve_media
 
 
 # List of pages' addresses.
@@ -13,6 +13,7 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     path('', include('blog.urls', namespace='blog')),
     path('pages/', include('pages.urls', namespace='pages')),
+    path('api/', include('api.urls', namespace='api')),
     path('auth/', include('django.contrib.auth.urls')),
     path(
         'auth/registration/',
@@ -23,16 +24,18 @@ urlpatterns = [
         ),
         name='registration',
     ),
+    # Served by Django or handed off to web server, see MEDIA_SERVE_MODE.
+    path(
+        settings.MEDIA_URL.lstrip('/') + '<path:path>',
+        serve_media,
+        name='media',
+    ),
 ]
 
 # List of custom handlers
 handler404 = 'pages.views.page_not_found'
 handler500 = 'pages.views.server_error'
 
-if settings.DEBUG:
+if 'debug_toolbar' in settings.INSTALLED_APPS:
     import debug_toolbar
     urlpatterns += (path('__debug__/', include(debug_toolbar.urls)),)
-    urlpatterns += static(
-        settings.MEDIA_URL,
-        document_root=settings.MEDIA_ROOT,
-    )
@@ -0,0 +1,57 @@
+# Django Library
+from django.contrib import admin
+from django.utils import timezone
+
+# Local Imports
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    """
+    Read-only view of background jobs queue.
+
+    Columns:
+    --------
+    name -> clickable, for filtering;
+    status -> for filtering;
+    attempts, run_after, created_at, finished_at -> informative.
+
+    Failed jobs can be queued again with an action.
+    """
+    list_display = (
+        'name',
+        'status',
+        'attempts',
+        'run_after',
+        'created_at',
+        'finished_at',
+    )
+    list_filter = (
+        'status',
+        'name',
+    )
+    readonly_fields = (
+        'name',
+        'payload',
+        'status',
+        'attempts',
+        'run_after',
+        'started_at',
+        'finished_at',
+        'error',
+        'created_at',
+    )
+    actions = ('retry',)
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.action(description='Повторить выбранные задачи')
+    def retry(self, request, queryset):
+        retried = queryset.exclude(status=Job.RUNNING).update(
+            status=Job.QUEUED,
+            attempts=0,
+            run_after=timezone.now(),
+        )
+        self.message_user(request, f'Задач поставлено в очередь: {retried}')
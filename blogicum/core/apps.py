@@ -1,7 +1,15 @@
 # Django Library
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        # Register signal handlers.
+        from . import signals  # noqa: F401
+        if settings.TEMPLATES_PREWARM:
+            from .prewarm import warm_templates
+            warm_templates()
@@ -0,0 +1,38 @@
+# Standart Library
+import hashlib
+import time
+
+# Django Library
+from django.core.cache import cache
+
+
+# Generation counters for O(1) invalidation of cached data.
+# Every key of a namespace includes its current generation,
+# so bumping the counter makes all of them unreachable at once,
+# and stale entries simply expire.
+def _generation_key(namespace: str) -> str:
+    return f'{namespace}:generation'
+
+
+def get_generation(namespace: str) -> int:
+    key = _generation_key(namespace)
+    generation = cache.get(key)
+    if generation is None:
+        # Start from current time, so generation lost on eviction
+        # never resurrects entries of an older one.
+        cache.add(key, time.time_ns(), timeout=None)
+        generation = cache.get(key)
+    return generation
+
+
+def bump_generation(namespace: str) -> None:
+    try:
+        cache.incr(_generation_key(namespace))
+    except ValueError:
+        cache.set(_generation_key(namespace), time.time_ns(), timeout=None)
+
+
+def page_cache_key(namespace: str, path: str) -> str:
+    # Key of a whole page: full path includes page number (query string).
+    digest = hashlib.md5(path.encode()).hexdigest()
+    return f'{namespace}:{get_generation(namespace)}:{digest}'
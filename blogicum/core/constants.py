@@ -1,2 +1,51 @@
 # To be used with Paginator.
 ITEMS_TO_SHOW = 10
+# Top-level comments (with all their replies) shown on post page
+# and loaded by "load more" at once.
+COMMENTS_TO_SHOW = 20
+# Replies to comments this deep are added next to them instead.
+COMMENT_MAX_DEPTH = 4
+
+# Seconds to keep total counts of paginated querysets.
+PAGINATOR_COUNT_CACHE_TIMEOUT = 60
+# Pages shown around the current one and at the ends of paginator.
+PAGINATOR_PAGES_ON_EACH_SIDE = 3
+PAGINATOR_PAGES_ON_ENDS = 1
+
+# Seconds to keep whole pages rendered for anonymous users.
+PAGE_CACHE_TIMEOUT = 300
+
+# Cookie pinning client to primary database after it has written
+# something, and for how many seconds (should exceed replication lag).
+REPLICA_PIN_COOKIE = 'use_primary'
+REPLICA_PIN_SECONDS = 10
+
+# Widths (px) of resized copies of post images and their JPEG/WebP
+# quality, see blog/images.py. Smaller images are never upscaled.
+POST_IMAGE_WIDTHS = {'card': 640, 'detail': 1280}
+POST_IMAGE_QUALITY = 80
+
+# Background jobs (core/jobs.py): attempts before job is failed,
+# delay before retry (doubles with each attempt) and
+# seconds after which running job is considered lost with its worker.
+JOB_MAX_ATTEMPTS = 3
+JOB_RETRY_DELAY = 30
+JOB_TIMEOUT = 600
+# Seconds between checks for jobs of lost workers.
+JOB_REQUEUE_INTERVAL = 60
+
+# Unreferenced media files saved or re-used (deduplicated) within
+# this many seconds are kept: they may belong to a post being saved.
+MEDIA_ORPHAN_GRACE = 3600
+
+# Seconds browsers may cache media files (core/views.py): files named
+# by hash of content never change, others are revalidated sooner.
+MEDIA_MAX_AGE = 60 * 60
+MEDIA_IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+# Objects per page of JSON API listings by default and at most (?limit=).
+API_PAGE_SIZE = 20
+API_MAX_PAGE_SIZE = 100
+
+# Posts in RSS and Atom feeds (blog/feeds.py).
+FEED_ITEMS = 20
@@ -0,0 +1,120 @@
+# Standart Library
+import logging
+import traceback
+from datetime import timedelta
+from typing import Callable, Dict, Optional
+
+# Django Library
+from django.db.models import F
+from django.utils import timezone
+
+# Local Imports
+from .constants import JOB_MAX_ATTEMPTS, JOB_RETRY_DELAY, JOB_TIMEOUT
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+# Database-backed job queue, no broker needed.
+#
+# Jobs are rows of core.Job, enqueued in the same transaction
+# as the data they process, so a job never sees uncommitted data
+# and is never lost if the transaction commits.
+# Workers (runworker command) take due jobs with a conditional UPDATE,
+# which succeeds for one worker only, on SQLite and PostgreSQL alike.
+# Failed jobs are retried with growing delay up to JOB_MAX_ATTEMPTS.
+_registry: Dict[str, Callable] = {}
+
+
+def register_job(name: str) -> Callable:
+    # Decorator registering function as job under name.
+    def decorator(function: Callable) -> Callable:
+        _registry[name] = function
+        return function
+    return decorator
+
+
+def enqueue(name: str, **payload) -> Job:
+    if name not in _registry:
+        raise KeyError(f'Unknown job: {name}')
+    return Job.objects.create(name=name, payload=payload)
+
+
+def enqueue_once(name: str, **payload) -> Job:
+    # Reuse queued job with the same payload,
+    # e.g. many changes of one object need one job.
+    queued = Job.objects.filter(
+        name=name,
+        status=Job.QUEUED,
+        payload=payload,
+    ).first()
+    return queued or enqueue(name, **payload)
+
+
+def requeue_lost_jobs() -> int:
+    # Jobs left running by a killed worker are queued again,
+    # or failed if it was their last attempt: a job crashing
+    # its worker must not be retried forever.
+    # Returns number of requeued jobs.
+    now = timezone.now()
+    lost = Job.objects.filter(
+        status=Job.RUNNING,
+        started_at__lt=now - timedelta(seconds=JOB_TIMEOUT),
+    )
+    failed = lost.filter(attempts__gte=JOB_MAX_ATTEMPTS).update(
+        status=Job.FAILED,
+        error='Worker was lost.',
+        finished_at=now,
+    )
+    if failed:
+        logger.error('%s lost jobs failed after the last attempt', failed)
+    return lost.update(status=Job.QUEUED)
+
+
+def claim_next_job() -> Optional[Job]:
+    now = timezone.now()
+    candidates = (Job.objects
+                  .filter(status=Job.QUEUED, run_after__lte=now)
+                  .order_by('run_after', 'pk')
+                  .values_list('pk', flat=True)[:10])
+    for pk in candidates:
+        claimed = Job.objects.filter(pk=pk, status=Job.QUEUED).update(
+            status=Job.RUNNING,
+            attempts=F('attempts') + 1,
+            started_at=now,
+        )
+        if claimed:
+            return Job.objects.get(pk=pk)
+    return None
+
+
+def run_job(job: Job) -> bool:
+    # Run claimed job, record result. Returns True on success.
+    try:
+        _registry[job.name](**job.payload)
+    except Exception:
+        logger.exception('Job %s failed', job)
+        job.error = traceback.format_exc()
+        if job.attempts < JOB_MAX_ATTEMPTS:
+            job.status = Job.QUEUED
+            job.run_after = timezone.now() + timedelta(
+                seconds=JOB_RETRY_DELAY * 2 ** (job.attempts - 1)
+            )
+        else:
+            job.status = Job.FAILED
+        job.finished_at = timezone.now()
+        job.save(update_fields=('status', 'run_after', 'error',
+                                'finished_at'))
+        return False
+    job.status = Job.DONE
+    job.error = ''
+    job.finished_at = timezone.now()
+    job.save(update_fields=('status', 'error', 'finished_at'))
+    return True
+
+
+def run_next_job() -> Optional[bool]:
+    # None if there was no due job.
+    job = claim_next_job()
+    if job is None:
+        return None
+    return run_job(job)
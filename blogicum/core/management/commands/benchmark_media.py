@@ -0,0 +1,92 @@
+# Standart Library
+import hashlib
+import os
+import statistics
+import tempfile
+import time
+
+# Django Library
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory, override_settings
+from django.views.static import serve
+
+# Local Imports
+from core.views import serve_media
+
+
+class Command(BaseCommand):
+    """
+    Compare serve_media with django.views.static.serve used in debug.
+
+    File named by hash of its content is requested whole,
+    revalidated with If-None-Match and requested by parts with Range,
+    views are called directly and whole response body is read.
+    """
+    help = 'Сравнивает время отдачи медиафайлов с отладочным представлением.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=200,
+            help='Requests per case and view.',
+        )
+        parser.add_argument(
+            '--size',
+            type=int,
+            default=1024,
+            help='Size of served file in KiB.',
+        )
+
+    def handle(self, *args, **options):
+        content = os.urandom(options['size'] * 1024)
+        digest = hashlib.sha256(content).hexdigest()
+        path = f'{digest[:2]}/{digest[2:4]}/{digest}.jpg'
+        cases = (
+            ('whole file', {}),
+            ('If-None-Match', {'HTTP_IF_NONE_MATCH': f'"{digest}"'}),
+            ('Range 64 KiB', {'HTTP_RANGE': 'bytes=0-65535'}),
+        )
+        with tempfile.TemporaryDirectory() as media_root:
+            os.makedirs(os.path.join(media_root, os.path.dirname(path)))
+            with open(os.path.join(media_root, path), 'wb') as file:
+                file.write(content)
+            views = (
+                ('static.serve', lambda request: serve(
+                    request, path, document_root=media_root
+                ), 'django'),
+                ('serve_media', lambda request: serve_media(request, path),
+                 'django'),
+                ('x-accel', lambda request: serve_media(request, path),
+                 'x-accel-redirect'),
+            )
+            self.stdout.write(
+                f'{"case":16}'
+                + ''.join(f'{name:>22}' for name, _, _ in views)
+            )
+            for case, headers in cases:
+                row = f'{case:16}'
+                for _, view, mode in views:
+                    with override_settings(
+                        MEDIA_ROOT=media_root, MEDIA_SERVE_MODE=mode
+                    ):
+                        status, timing = self.measure(
+                            view, headers, options['requests']
+                        )
+                    row += f'{timing:12.3f} ms ({status})'.rjust(22)
+                self.stdout.write(row)
+
+    @staticmethod
+    def measure(view, headers, requests):
+        # Status and median time of request in milliseconds.
+        factory = RequestFactory()
+        timings = []
+        for _ in range(requests):
+            request = factory.get('/media/', **headers)
+            start = time.perf_counter()
+            response = view(request)
+            if response.streaming:
+                b''.join(response.streaming_content)
+            response.close()
+            timings.append((time.perf_counter() - start) * 1000)
+        return response.status_code, statistics.median(timings)
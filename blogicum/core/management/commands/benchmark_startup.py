@@ -0,0 +1,98 @@
+# Standart Library
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# Django Library
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Runs in a fresh interpreter for every measurement.
+STARTUP_SCRIPT = '''
+import json
+import time
+
+start = time.perf_counter()
+from django.core.wsgi import get_wsgi_application
+application = get_wsgi_application()
+ready = time.perf_counter()
+from django.test import Client
+try:
+    Client().get('/pages/about/')
+    first_request = (time.perf_counter() - ready) * 1000
+except Exception:
+    first_request = None
+print(json.dumps({
+    'setup': (ready - start) * 1000,
+    'first_request': first_request,
+}))
+'''
+
+
+class Command(BaseCommand):
+    """
+    Compare startup time of settings profiles.
+
+    Every run starts new interpreter with given BLOGICUM_PROFILE,
+    loads WSGI application and serves first request.
+    First request is not measured for prod profile
+    until collectstatic has been run.
+    """
+    help = 'Сравнивает время запуска приложения с разными настройками.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--runs',
+            type=int,
+            default=5,
+            help='Runs per profile.',
+        )
+        parser.add_argument(
+            '--profiles',
+            nargs='+',
+            default=['dev', 'prod', 'bench'],
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f'{"profile":10} {"process, ms":>12} {"setup, ms":>10} '
+            f'{"first request, ms":>18}'
+        )
+        for profile in options['profiles']:
+            runs = [self.run(profile) for _ in range(options['runs'])]
+            first_requests = [run['first_request'] for run in runs
+                              if run['first_request'] is not None]
+            first_request = (f'{statistics.median(first_requests):18.1f}'
+                             if first_requests else f'{"n/a":>18}')
+            self.stdout.write(
+                f'{profile:10} '
+                f'{statistics.median(r["process"] for r in runs):12.1f} '
+                f'{statistics.median(r["setup"] for r in runs):10.1f} '
+                f'{first_request}'
+            )
+
+    @staticmethod
+    def run(profile):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            env = {
+                **os.environ,
+                'DJANGO_SETTINGS_MODULE': 'blogicum.settings',
+                'BLOGICUM_PROFILE': profile,
+                'BLOGICUM_ALLOWED_HOSTS': 'testserver',
+                'BLOGICUM_CACHE_DIR': cache_dir,
+            }
+            start = time.perf_counter()
+            output = subprocess.run(
+                [sys.executable, '-c', STARTUP_SCRIPT],
+                cwd=settings.BASE_DIR,
+                env=env,
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+            process = (time.perf_counter() - start) * 1000
+        return {'process': process, **json.loads(output.splitlines()[-1])}
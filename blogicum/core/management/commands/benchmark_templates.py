@@ -0,0 +1,103 @@
+# Standart Library
+import statistics
+import time
+from copy import deepcopy
+
+# Django Library
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import Client, override_settings
+from django.urls import reverse
+
+# Local Imports
+from blog.models import Category, Post, User
+from core.prewarm import warm_templates
+
+PLAIN_LOADERS = [
+    'django.template.loaders.filesystem.Loader',
+    'django.template.loaders.app_directories.Loader',
+]
+CACHED_LOADERS = [('django.template.loaders.cached.Loader', PLAIN_LOADERS)]
+
+
+class Command(BaseCommand):
+    """
+    Compare render time of pages with plain and cached template loaders.
+
+    Pages are requested with test client against current database,
+    page and fragment caches are disabled to measure rendering itself.
+    """
+    help = 'Сравнивает время отрисовки страниц с кешированием шаблонов и без.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=50,
+            help='Requests per page and loader.',
+        )
+
+    def handle(self, *args, **options):
+        pages = self.get_pages()
+        results = {}
+        for name, loaders in (('plain', PLAIN_LOADERS),
+                              ('cached', CACHED_LOADERS)):
+            with override_settings(
+                DEBUG=False,
+                ALLOWED_HOSTS=['testserver'],
+                TEMPLATES=self.templates_with(loaders),
+                CACHES={'default': {
+                    'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+                }},
+            ):
+                if name == 'cached':
+                    warm_templates()
+                results[name] = {
+                    url: self.measure(url, options['requests'])
+                    for url in pages
+                }
+
+        self.stdout.write(f'{"page":40} {"plain, ms":>10} {"cached, ms":>10}')
+        for url in pages:
+            self.stdout.write(
+                f'{url:40} {results["plain"][url]:10.2f} '
+                f'{results["cached"][url]:10.2f}'
+            )
+
+    @staticmethod
+    def templates_with(loaders):
+        templates = deepcopy(settings.TEMPLATES)
+        templates[0]['APP_DIRS'] = False
+        templates[0]['OPTIONS']['loaders'] = loaders
+        return templates
+
+    @staticmethod
+    def get_pages():
+        pages = [
+            reverse('blog:index'),
+            reverse('pages:about'),
+            reverse('pages:rules'),
+        ]
+        post = Post.published_posts.first()
+        if post:
+            pages.append(reverse('blog:post_detail', args=(post.pk,)))
+        category = Category.objects.filter(is_published=True).first()
+        if category:
+            pages.append(
+                reverse('blog:category_posts', args=(category.slug,))
+            )
+        user = User.objects.first()
+        if user:
+            pages.append(reverse('blog:profile', args=(user.username,)))
+        return pages
+
+    @staticmethod
+    def measure(url, requests):
+        # Median time of request in milliseconds.
+        client = Client()
+        timings = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            client.get(url)
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
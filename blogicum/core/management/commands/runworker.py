@@ -0,0 +1,61 @@
+# Standart Library
+import time
+
+# Django Library
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+# Local Imports
+from core.constants import JOB_REQUEUE_INTERVAL
+from core.jobs import requeue_lost_jobs, run_next_job
+
+
+class Command(BaseCommand):
+    """
+    Run background jobs from database queue (see core/jobs.py).
+
+    Takes due jobs one by one and sleeps --interval seconds
+    when the queue is empty. Start several workers for more throughput,
+    each of them requeues jobs of lost workers
+    every JOB_REQUEUE_INTERVAL seconds.
+    With --once exits as soon as there are no due jobs (for cron).
+    """
+    help = 'Выполняет фоновые задачи из очереди.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Exit when there are no due jobs.',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=1.0,
+            help='Seconds to wait for new jobs.',
+        )
+
+    def handle(self, *args, **options):
+        done = failed = 0
+        checked_at = None
+        while True:
+            # Long running process, drop broken or expired connections.
+            close_old_connections()
+            # Other workers may be killed while this one runs.
+            if (checked_at is None
+                    or time.monotonic() - checked_at >= JOB_REQUEUE_INTERVAL):
+                requeued = requeue_lost_jobs()
+                if requeued:
+                    self.stderr.write(f'Requeued {requeued} lost jobs')
+                checked_at = time.monotonic()
+            result = run_next_job()
+            if result is None:
+                if options['once']:
+                    break
+                time.sleep(options['interval'])
+                continue
+            if result:
+                done += 1
+            else:
+                failed += 1
+        self.stdout.write(f'Done {done} jobs, failed {failed}')
@@ -0,0 +1,120 @@
+# Standart Library
+import multiprocessing
+import random
+import time
+
+# Django Library
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connections, transaction
+from django.utils import timezone
+
+# Local Imports
+from blog.models import Category, Comment, Post, User
+from core.constants import ITEMS_TO_SHOW
+
+
+def write_comments(post_ids, user_id, deadline, results):
+    # Same work as AddComment view does.
+    done = errors = 0
+    while time.monotonic() < deadline:
+        try:
+            with transaction.atomic():
+                Comment.objects.create(
+                    post_id=random.choice(post_ids),
+                    author_id=user_id,
+                    text='Stress test comment',
+                )
+            done += 1
+        except OperationalError:
+            errors += 1
+    connections.close_all()
+    results.put(('write', done, errors))
+
+
+def read_feed(deadline, results):
+    # Same queries as PostListView does.
+    done = errors = 0
+    while time.monotonic() < deadline:
+        try:
+            list(
+                Post.published_posts
+                .select_related('author', 'location', 'category')
+                .order_by('-pub_date')[:ITEMS_TO_SHOW]
+            )
+            done += 1
+        except OperationalError:
+            errors += 1
+    connections.close_all()
+    results.put(('read', done, errors))
+
+
+class Command(BaseCommand):
+    """
+    Concurrency stress test for SQLite database.
+
+    Several processes write comments while others read the feed.
+    Reports throughput and number of "database is locked" errors,
+    fails if there were any.
+    Run it against a copy of the database: it adds comments
+    (and a test post if there are none).
+    """
+    help = 'Нагрузочный тест SQLite: параллельные запись и чтение.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--writers', type=int, default=4)
+        parser.add_argument('--readers', type=int, default=4)
+        parser.add_argument('--seconds', type=float, default=5)
+
+    def handle(self, *args, **options):
+        user, post_ids = self.prepare()
+        # Children must open their own connections.
+        connections.close_all()
+        context = multiprocessing.get_context('fork')
+        results = context.Queue()
+        deadline = time.monotonic() + options['seconds']
+        processes = [
+            context.Process(
+                target=write_comments,
+                args=(post_ids, user.pk, deadline, results),
+            )
+            for _ in range(options['writers'])
+        ] + [
+            context.Process(target=read_feed, args=(deadline, results))
+            for _ in range(options['readers'])
+        ]
+        for process in processes:
+            process.start()
+        totals = {'write': [0, 0], 'read': [0, 0]}
+        for _ in processes:
+            kind, done, errors = results.get()
+            totals[kind][0] += done
+            totals[kind][1] += errors
+        for process in processes:
+            process.join()
+
+        for kind, (done, errors) in totals.items():
+            self.stdout.write(
+                f'{kind}: {done / options["seconds"]:.1f} ops/s, '
+                f'{errors} lock errors'
+            )
+        if totals['write'][1] or totals['read'][1]:
+            raise CommandError('Database was locked')
+
+    @staticmethod
+    def prepare():
+        user = User.objects.order_by('pk').first()
+        if user is None:
+            user = User.objects.create_user(username='stress')
+        post_ids = list(Post.objects.values_list('pk', flat=True)[:100])
+        if not post_ids:
+            category = Category.objects.create(
+                title='Stress', slug='stress', description='Stress test',
+            )
+            post_ids = [Post.objects.create(
+                title='Stress',
+                text='Stress test post',
+                pub_date=timezone.now(),
+                author=user,
+                category=category,
+            ).pk]
+        return user, post_ids
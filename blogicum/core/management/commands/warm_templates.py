@@ -0,0 +1,26 @@
+# Standart Library
+import time
+
+# Django Library
+from django.core.management.base import BaseCommand
+
+# Local Imports
+from core.prewarm import warm_templates
+
+
+class Command(BaseCommand):
+    """
+    Load and parse all project templates.
+
+    Useful to check templates for syntax errors before deploy
+    and to see how long pre-warming on startup takes.
+    """
+    help = 'Загружает и разбирает все шаблоны проекта.'
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        loaded = warm_templates()
+        elapsed = (time.perf_counter() - start) * 1000
+        self.stdout.write(self.style.SUCCESS(
+            f'Loaded {loaded} templates in {elapsed:.1f} ms'
+        ))
@@ -0,0 +1,41 @@
+# Django Library
+from django.conf import settings
+
+# Local Imports
+from .constants import REPLICA_PIN_COOKIE, REPLICA_PIN_SECONDS
+from .routers import read_from_replica
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Let read-only requests read from replicas.
+
+    ...
+
+    After a write (any unsafe request) client is pinned to primary
+    for REPLICA_PIN_SECONDS by cookie, so it reads its own writes
+    even if replicas lag behind.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = read_from_replica.set(
+            request.method in SAFE_METHODS
+            and REPLICA_PIN_COOKIE not in request.COOKIES
+        )
+        try:
+            response = self.get_response(request)
+        finally:
+            read_from_replica.reset(token)
+        if request.method not in SAFE_METHODS and settings.DATABASE_REPLICAS:
+            response.set_cookie(
+                REPLICA_PIN_COOKIE,
+                '1',
+                max_age=REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite='Lax',
+            )
+        return response
@@ -1,3 +1,6 @@
+# Standart Library
+from datetime import timedelta
+
 # Django Library
 from django.db import models
 from django.utils import timezone
@@ -6,12 +9,18 @@ from django.utils import timezone
 # Custom manager that checks if post is to be shown.
 # (is_published flag is on, pub_date is not in the future,
 # and category is published)
+# All of it is materialized in visible flag (see blog.models.Post),
+# so the listing is a range scan over single table.
+# pub_date is compared as is (no date cast) so indexes on it are used.
+# Current time is rounded up to the minute: SQL of the queryset
+# stays the same within a minute and cached counts can be reused.
 class PublishedManager(models.Manager):
     def get_queryset(self):
+        now = (timezone.now().replace(second=0, microsecond=0)
+               + timedelta(minutes=1))
         return super().get_queryset().filter(
-            is_published=True,
-            pub_date__date__lte=timezone.now(),
-            category__is_published=True,
+            visible=True,
+            pub_date__lt=now,
         )
 
 
@@ -53,3 +62,82 @@ class TitleModel(models.Model):
     # Override of str method. Returns user-friendly name of entity.
     def __str__(self):
         return self.title
+
+
+class Job(CreatedAtModel):
+    """
+    Background job in database-backed queue (see core/jobs.py).
+
+    ...
+
+    Fields:
+    -------
+    name: CharField
+        name job function is registered under
+    payload: JSONField
+        keyword arguments of job function
+    status: CharField
+        queued -> running -> done,
+        or back to queued for retry, or failed after the last attempt
+    attempts: PositiveSmallIntegerField
+        number of times job was started
+    run_after: DateTimeField
+        job is not taken before this time (delays retries)
+    started_at, finished_at: DateTimeField
+        time of the last attempt
+    error: TextField
+        traceback of the last failure
+    """
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUSES = (
+        (QUEUED, 'В очереди'),
+        (RUNNING, 'Выполняется'),
+        (DONE, 'Выполнено'),
+        (FAILED, 'Ошибка'),
+    )
+
+    name = models.CharField(max_length=128, verbose_name='Задача')
+    payload = models.JSONField(default=dict, verbose_name='Параметры')
+    status = models.CharField(
+        max_length=16,
+        choices=STATUSES,
+        default=QUEUED,
+        verbose_name='Статус',
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name='Попыток',
+    )
+    run_after = models.DateTimeField(
+        default=timezone.now,
+        verbose_name='Не раньше',
+    )
+    started_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Начато',
+    )
+    finished_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Закончено',
+    )
+    error = models.TextField(blank=True, verbose_name='Ошибка')
+
+    class Meta:
+        verbose_name = 'фоновая задача'
+        verbose_name_plural = 'Фоновые задачи'
+        indexes = (
+            # Worker polls for the next due job.
+            models.Index(
+                fields=('run_after',),
+                condition=models.Q(status='queued'),
+                name='job_queued_run_after_idx',
+            ),
+        )
+
+    def __str__(self):
+        return f'{self.name} #{self.pk}'
@@ -0,0 +1,218 @@
+# Standart Library
+import base64
+import hashlib
+import json
+from collections.abc import Sequence
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+# Django Library
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import InvalidPage, Page, Paginator
+from django.db.models import Q, QuerySet
+from django.utils.functional import cached_property
+
+# Local Imports
+from .cache import get_generation
+from .constants import (
+    PAGINATOR_COUNT_CACHE_TIMEOUT,
+    PAGINATOR_PAGES_ON_EACH_SIDE,
+    PAGINATOR_PAGES_ON_ENDS,
+)
+
+
+class WindowedPage(Page):
+    """
+    Page that lists only a window of page numbers around itself.
+    """
+    @property
+    def page_window(self) -> Iterator[Union[int, str]]:
+        # Page numbers and ELLIPSIS placeholders between them.
+        return self.paginator.get_elided_page_range(
+            self.number,
+            on_each_side=PAGINATOR_PAGES_ON_EACH_SIDE,
+            on_ends=PAGINATOR_PAGES_ON_ENDS,
+        )
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator which keeps total count of objects in cache.
+
+    ...
+
+    Count is cached per SQL of the queryset and database for a short time
+    and keyed by generation of cache_namespace,
+    which is bumped when counted objects change (see blog/signals.py).
+    Windowed pages keep rendering cost independent of number of pages.
+    """
+    cache_namespace = 'posts'
+
+    @cached_property
+    def count(self) -> int:
+        query = getattr(self.object_list, 'query', None)
+        if query is None:
+            return super().count
+        try:
+            sql = str(query)
+        except EmptyResultSet:
+            # queryset.none() has no SQL and nothing to count.
+            return 0
+        signature = hashlib.md5(sql.encode()).hexdigest()
+        # Database alias is a part of the key: lagging replica
+        # may return another count than primary.
+        key = (f'paginator:count:{get_generation(self.cache_namespace)}:'
+               f'{self.object_list.db}:{signature}')
+        count = cache.get(key)
+        if count is None:
+            count = super().count
+            cache.set(key, count, PAGINATOR_COUNT_CACHE_TIMEOUT)
+        return count
+
+    def _get_page(self, *args, **kwargs) -> WindowedPage:
+        return WindowedPage(*args, **kwargs)
+
+
+class CursorPage(Sequence):
+    """
+    Page of keyset pagination.
+
+    ...
+
+    Mimics django.core.paginator.Page where it makes sense,
+    but instead of page numbers knows opaque cursors of
+    the neighbouring pages.
+    """
+    def __init__(
+        self,
+        object_list: List[Any],
+        paginator: 'CursorPaginator',
+        next_cursor: Optional[str] = None,
+        previous_cursor: Optional[str] = None,
+    ):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __repr__(self):
+        return f'<CursorPage of {len(self)} items>'
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator:
+    """
+    Keyset (cursor) paginator.
+
+    ...
+
+    Instead of OFFSET pages are selected with range condition
+    on ordering fields, so any page costs the same as the first one
+    and no COUNT(*) is required.
+    Ordering must be unique (end it with pk) and have the same
+    direction for all the fields.
+
+    Cursor is a base64 encoded json:
+    [direction, *values of ordering fields of the boundary item],
+    where direction is 'n' for the next page and 'p' for the previous.
+    """
+    is_cursor = True
+
+    def __init__(
+        self,
+        queryset: QuerySet,
+        per_page: int,
+        ordering: Tuple[str, ...] = ('-pub_date', '-pk'),
+    ):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.ordering = ordering
+        self.descending = ordering[0].startswith('-')
+        self.fields = [field.lstrip('-') for field in ordering]
+
+    def page(self, cursor: Optional[str] = None) -> CursorPage:
+        if not cursor:
+            direction, values = 'n', None
+        else:
+            direction, values = self.decode_cursor(cursor)
+        backwards = direction == 'p'
+
+        queryset = self.queryset.order_by(*(
+            self._reverse(field) if backwards else field
+            for field in self.ordering
+        ))
+        if values is not None:
+            queryset = queryset.filter(self._after(values, backwards))
+        # One extra row tells if there is something beyond this page.
+        items = list(queryset[:self.per_page + 1])
+        has_more = len(items) > self.per_page
+        items = items[:self.per_page]
+        if backwards:
+            items.reverse()
+
+        if not items:
+            return CursorPage(items, self)
+        has_next = has_more if not backwards else True
+        has_previous = has_more if backwards else values is not None
+        return CursorPage(
+            items,
+            self,
+            next_cursor=(self.encode_cursor('n', items[-1])
+                         if has_next else None),
+            previous_cursor=(self.encode_cursor('p', items[0])
+                             if has_previous else None),
+        )
+
+    def encode_cursor(self, direction: str, item: Any) -> str:
+        values = [self._get_field(name).value_to_string(item)
+                  for name in self.fields]
+        raw = json.dumps([direction, *values], separators=(',', ':'))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor: str) -> Tuple[str, List[Any]]:
+        try:
+            padding = '=' * (-len(cursor) % 4)
+            direction, *values = json.loads(
+                base64.urlsafe_b64decode(cursor + padding)
+            )
+            if (direction not in ('n', 'p')
+                    or len(values) != len(self.fields)):
+                raise ValueError
+            values = [self._get_field(name).to_python(value)
+                      for name, value in zip(self.fields, values)]
+        except Exception:
+            raise InvalidPage('Invalid cursor')
+        return direction, values
+
+    def _get_field(self, name: str):
+        opts = self.queryset.model._meta
+        return opts.pk if name == 'pk' else opts.get_field(name)
+
+    def _after(self, values: List[Any], backwards: bool) -> Q:
+        # Row-value comparison (a, b) < (x, y) expanded to
+        # a < x OR (a = x AND b < y), which databases handle with index.
+        lookup = 'lt' if self.descending != backwards else 'gt'
+        condition = Q()
+        for i, name in enumerate(self.fields):
+            equal = {field: value for field, value
+                     in zip(self.fields[:i], values[:i])}
+            condition |= Q(**equal, **{f'{name}__{lookup}': values[i]})
+        return condition
+
+    @staticmethod
+    def _reverse(field: str) -> str:
+        return field[1:] if field.startswith('-') else f'-{field}'
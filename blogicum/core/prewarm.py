@@ -0,0 +1,25 @@
+# Standart Library
+from pathlib import Path
+
+# Django Library
+from django.template import engines
+from django.template.backends.django import DjangoTemplates
+
+
+def warm_templates() -> int:
+    """
+    Load every template from DIRS of Django template engines.
+
+    With cached loader parsed templates are kept for the lifetime
+    of the process, so the first requests don't pay for parsing.
+    Returns number of loaded templates.
+    """
+    loaded = 0
+    for engine in engines.all():
+        if not isinstance(engine, DjangoTemplates):
+            continue
+        for directory in map(Path, engine.dirs):
+            for path in sorted(directory.rglob('*.html')):
+                engine.get_template(path.relative_to(directory).as_posix())
+                loaded += 1
+    return loaded
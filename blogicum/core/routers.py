@@ -0,0 +1,32 @@
+# Standart Library
+import random
+from contextvars import ContextVar
+
+# Django Library
+from django.conf import settings
+
+# Set by ReplicaRoutingMiddleware for requests allowed to read replicas.
+read_from_replica = ContextVar('read_from_replica', default=False)
+
+
+class PrimaryReplicaRouter:
+    """
+    Send reads of read-only requests to replicas, everything else to primary.
+
+    ...
+
+    Replicas are aliases from settings.DATABASE_REPLICAS,
+    without them every query goes to default database.
+    Code outside of requests (commands, shell) always uses primary.
+    """
+    def db_for_read(self, model, **hints):
+        if read_from_replica.get() and settings.DATABASE_REPLICAS:
+            return random.choice(settings.DATABASE_REPLICAS)
+        return 'default'
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as primary.
+        return True
@@ -0,0 +1,113 @@
+# Standart Library
+import gzip
+import hashlib
+import os
+import re
+import shutil
+import uuid
+from typing import Optional
+
+# Django Library
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.storage import FileSystemStorage
+
+# Name of file stored by ContentAddressedStorage: sha256 and extension.
+CONTENT_ADDRESSED_RE = re.compile(r'^(?P<digest>[0-9a-f]{64})(\.\w+)?$')
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    Manifest storage that also writes gzipped copies of text files.
+
+    ...
+
+    Compressed copy is saved next to the hashed file with .gz suffix
+    and kept only if it is actually smaller than the original.
+    """
+    compressible_extensions = (
+        '.css', '.js', '.svg', '.txt', '.html', '.map', '.json', '.ico',
+    )
+
+    def post_process(self, *args, **kwargs):
+        for name, hashed_name, processed in super().post_process(
+            *args, **kwargs
+        ):
+            if (isinstance(hashed_name, str)
+                    and hashed_name.endswith(self.compressible_extensions)):
+                self.compress(hashed_name)
+            yield name, hashed_name, processed
+
+    def compress(self, name: str) -> None:
+        path = self.path(name)
+        compressed_path = f'{path}.gz'
+        with open(path, 'rb') as source:
+            with gzip.open(compressed_path, 'wb') as target:
+                shutil.copyfileobj(source, target)
+        if self.size(f'{name}.gz') >= self.size(name):
+            self.delete(f'{name}.gz')
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    File system storage that names files by sha256 of their content.
+
+    ...
+
+    Uploaded post_images/photo.JPG is stored as
+    post_images/ab/cd/abcd...ef.jpg, directory part of the name is kept,
+    two levels of shards keep directories small.
+    Identical uploads get the same name and are written once,
+    so names never collide and files are never overwritten.
+    A file can be shared by several objects, whoever deletes
+    references must check no other object uses it
+    (see blog.images.release_files). Re-used files get fresh
+    modification time, so recently modified ones may be in use
+    by an object not committed yet.
+    """
+    chunk_size = 64 * 1024
+
+    def _save(self, name: str, content) -> str:
+        digest = hashlib.sha256()
+        content.seek(0)
+        for chunk in content.chunks(self.chunk_size):
+            digest.update(chunk)
+        hexdigest = digest.hexdigest()
+        directory, filename = os.path.split(name)
+        extension = os.path.splitext(filename)[1].lower()
+        name = os.path.join(
+            directory, hexdigest[:2], hexdigest[2:4], hexdigest + extension
+        )
+        if self.exists(name):
+            # Same content is already there, mark it as used again.
+            os.utime(self.path(name))
+            return name
+        # Written under a temporary name and moved in place atomically:
+        # concurrent uploads of the same content just replace each other.
+        temporary = super()._save(
+            os.path.join(directory, f'.{uuid.uuid4().hex}.tmp'),
+            content,
+        )
+        os.makedirs(os.path.dirname(self.path(name)), exist_ok=True)
+        os.replace(self.path(temporary), self.path(name))
+        return name
+
+    def get_available_name(self, name: str, max_length=None) -> str:
+        # Final name is known only from content, see _save().
+        return name
+
+    def delete(self, name: str) -> None:
+        super().delete(name)
+        # Drop emptied shard directories.
+        directory = os.path.dirname(self.path(name))
+        for _ in range(2):
+            try:
+                os.rmdir(directory)
+            except OSError:
+                break
+            directory = os.path.dirname(directory)
+
+
+def content_digest(name: str) -> Optional[str]:
+    # sha256 of content addressed file from its name, None for others.
+    match = CONTENT_ADDRESSED_RE.match(os.path.basename(name))
+    return match and match['digest']
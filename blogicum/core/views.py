@@ -0,0 +1,167 @@
+# Standart Library
+import mimetypes
+import os
+import posixpath
+import re
+from typing import BinaryIO, Iterator, Optional, Tuple
+from urllib.parse import quote
+
+# Django Library
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpResponse,
+    StreamingHttpResponse,
+)
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.http import require_safe
+
+# Local Imports
+from .constants import MEDIA_IMMUTABLE_MAX_AGE, MEDIA_MAX_AGE
+from .storage import content_digest
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+CHUNK_SIZE = 64 * 1024
+
+
+@require_safe
+def serve_media(request, path: str):
+    """
+    Serve file from MEDIA_ROOT.
+
+    ...
+
+    Unlike django.views.static.serve it is meant for production:
+    answers If-None-Match/If-Modified-Since with 304, single
+    byte range of Range header with 206, and with MEDIA_SERVE_MODE
+    hands file off to web server by X-Accel-Redirect or X-Sendfile
+    header instead of streaming it through Python.
+    Files named by hash of content (see ContentAddressedStorage)
+    get that hash as ETag and are cached by browsers for a year.
+    """
+    full_path = _media_path(path)
+    stat = os.stat(full_path)
+    digest = content_digest(path)
+    etag = quote_etag(digest or f'{int(stat.st_mtime):x}-{stat.st_size:x}')
+    last_modified = http_date(stat.st_mtime)
+    response = get_conditional_response(
+        request, etag=etag, last_modified=int(stat.st_mtime)
+    )
+    if response is None:
+        response = _file_response(
+            request, path, full_path, stat.st_size,
+            validators=(etag, last_modified),
+        )
+    response['ETag'] = etag
+    response['Last-Modified'] = last_modified
+    if digest:
+        patch_cache_control(
+            response, public=True, max_age=MEDIA_IMMUTABLE_MAX_AGE,
+            immutable=True,
+        )
+    else:
+        patch_cache_control(response, public=True, max_age=MEDIA_MAX_AGE)
+    return response
+
+
+def _media_path(path: str) -> str:
+    # Absolute path of existing file, hidden files
+    # (e.g. temporary ones of storage) and directories are not served.
+    path = posixpath.normpath(path).lstrip('/')
+    if any(part.startswith('.') for part in path.split('/')):
+        raise Http404
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+    except SuspiciousFileOperation:
+        raise Http404
+    if not os.path.isfile(full_path):
+        raise Http404
+    return full_path
+
+
+def _file_response(
+    request,
+    path: str,
+    full_path: str,
+    size: int,
+    validators: Tuple[str, str],
+):
+    content_type, encoding = mimetypes.guess_type(full_path)
+    content_type = content_type or 'application/octet-stream'
+    # Web server checks Range itself when file is handed off.
+    if settings.MEDIA_SERVE_MODE == 'x-accel-redirect':
+        response = HttpResponse(content_type=content_type)
+        response['X-Accel-Redirect'] = quote(
+            settings.MEDIA_ACCEL_PREFIX + path
+        )
+        return response
+    if settings.MEDIA_SERVE_MODE == 'x-sendfile':
+        response = HttpResponse(content_type=content_type)
+        response['X-Sendfile'] = full_path
+        return response
+
+    byte_range = _byte_range(request.headers.get('Range'), size)
+    if_range = request.headers.get('If-Range')
+    if if_range and if_range not in validators:
+        # File has changed since client got its part, send it whole.
+        byte_range = None
+    if byte_range is None:
+        response = FileResponse(
+            open(full_path, 'rb'), content_type=content_type
+        )
+    else:
+        first, last = byte_range
+        if first >= size:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+        file = open(full_path, 'rb')
+        file.seek(first)
+        response = StreamingHttpResponse(
+            _read(file, last - first + 1),
+            status=206,
+            content_type=content_type,
+        )
+        response['Content-Length'] = last - first + 1
+        response['Content-Range'] = f'bytes {first}-{last}/{size}'
+    if encoding:
+        response['Content-Encoding'] = encoding
+    response['Accept-Ranges'] = 'bytes'
+    return response
+
+
+def _byte_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    # First and last byte of single range in Range header.
+    # None to send whole file: no header, several or malformed ranges.
+    # First byte past the end of file means range is not satisfiable.
+    match = RANGE_RE.match(header or '')
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if not first:
+        # Suffix range: last N bytes.
+        length = int(last)
+        if not length:
+            return size, size
+        return max(size - length, 0), size - 1
+    first = int(first)
+    if last and int(last) < first:
+        return None
+    last = min(int(last), size - 1) if last else size - 1
+    return first, last
+
+
+def _read(file: BinaryIO, length: int) -> Iterator[bytes]:
+    try:
+        while length > 0:
+            chunk = file.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+    finally:
+        file.close()
@@ -18,6 +18,22 @@ from conftest import (
 )
 
 
+@pytest.fixture
+def blend_posts(mixer: Mixer):
+    # Posts dated in the past, one day apart, newest first.
+    def blend(n: int, is_published: bool = True, **kwargs) -> list:
+        past_dates = (
+            datetime.now(tz=pytz.UTC) - timedelta(days=day)
+            for day in range(1, n + 1)
+        )
+        return mixer.cycle(n).blend(
+            "blog.Post", is_published=is_published, pub_date=past_dates,
+            **kwargs
+        )
+
+    return blend
+
+
 @pytest.fixture
 def posts_with_unpublished_category(mixer: Mixer, user: Model):
     return mixer.cycle(N_PER_FIXTURE).blend(
@@ -0,0 +1,106 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _get(client, url: str, **params):
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(url, params)
+    return response, ctx.captured_queries
+
+
+def test_api_posts_follow_visibility_and_pages(
+        blend_posts, user, published_category, client
+):
+    posts = blend_posts(5, author=user, category=published_category)
+    hidden = blend_posts(
+        1, is_published=False, author=user, category=published_category
+    )[0]
+
+    seen, url = [], "/api/v1/posts/?limit=2"
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["results"]) <= 2
+        seen += [post["id"] for post in data["results"]]
+        url = data["next"]
+    expected = sorted(posts, key=lambda post: (post.pub_date, post.pk))
+    assert seen == [post.pk for post in reversed(expected)], (
+        "Убедитесь, что API отдаёт только опубликованные публикации,"
+        " от новых к старым, по страницам."
+    )
+
+    post = client.get(f"/api/v1/posts/{posts[0].pk}/").json()
+    assert post["author"] == user.username
+    assert post["category"] == published_category.slug
+    response = client.get(f"/api/v1/posts/{hidden.pk}/")
+    assert response.status_code == 404
+    assert "detail" in response.json()
+
+
+def test_api_sparse_fieldsets_shape_queries(
+        blend_posts, user, published_category, client
+):
+    blend_posts(3, author=user, category=published_category)
+
+    response, queries = _get(client, "/api/v1/posts/", fields="id,title")
+    assert all(
+        set(post) == {"id", "title"} for post in response.json()["results"]
+    ), "Убедитесь, что API отдаёт только поля, перечисленные в ?fields=."
+    assert len(queries) == 1
+    sql = queries[0]["sql"]
+    assert '"text"' not in sql and "JOIN" not in sql, (
+        "Убедитесь, что API загружает из базы только запрошенные поля."
+    )
+
+    few = len(_get(client, "/api/v1/posts/", fields="author,location")[1])
+    blend_posts(10, author=user, category=published_category)
+    response, queries = _get(
+        client, "/api/v1/posts/", fields="author,location"
+    )
+    assert len(queries) == few == 1, (
+        "Убедитесь, что связанные объекты загружаются одним запросом"
+        " вместе с публикациями."
+    )
+    assert response.json()["results"][0]["author"] == user.username
+
+    response = client.get("/api/v1/posts/", {"fields": "id,password"})
+    assert response.status_code == 400
+    assert client.get(
+        "/api/v1/posts/", {"cursor": "broken"}
+    ).status_code == 400
+
+
+def test_api_comments_categories_and_profiles(
+        mixer: Mixer, post_with_published_location, user, client
+):
+    post = post_with_published_location
+    comments = mixer.cycle(3).blend("blog.Comment", post=post)
+    data = client.get(f"/api/v1/posts/{post.pk}/comments/").json()
+    assert [comment["id"] for comment in data["results"]] == [
+        comment.pk for comment in comments
+    ]
+    assert client.get(
+        f"/api/v1/comments/{comments[0].pk}/", {"fields": "text"}
+    ).json() == {"text": comments[0].text}
+
+    category = post.category
+    assert client.get(
+        f"/api/v1/categories/{category.slug}/"
+    ).json()["title"] == category.title
+    category.is_published = False
+    category.save()
+    assert client.get(
+        f"/api/v1/categories/{category.slug}/"
+    ).status_code == 404
+    assert client.get(
+        f"/api/v1/posts/{post.pk}/comments/"
+    ).status_code == 404
+
+    profile = client.get(f"/api/v1/profiles/{user.username}/").json()
+    assert profile["username"] == user.username
+    assert "email" not in profile and "password" not in profile
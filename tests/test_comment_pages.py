@@ -0,0 +1,173 @@
+import re
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+COMMENT_RE = re.compile(r'name="comment_(\d+)"')
+MORE_RE = re.compile(r'data-comments-url="([^"]+)"')
+
+
+def _comment_ids(content: str) -> list:
+    return [int(pk) for pk in COMMENT_RE.findall(content)]
+
+
+def _add_comments(mixer: Mixer, post, n: int) -> list:
+    return [
+        comment.pk for comment in mixer.cycle(n).blend(
+            "blog.Comment", post=post, text=mixer.RANDOM
+        )
+    ]
+
+
+def test_comments_are_loaded_by_pages(
+        mixer: Mixer, post_with_published_location, client
+):
+    from core.constants import COMMENTS_TO_SHOW
+
+    post = post_with_published_location
+    comments = _add_comments(mixer, post, COMMENTS_TO_SHOW * 2 + 5)
+
+    content = client.get(f"/posts/{post.pk}/").content.decode("utf-8")
+    assert _comment_ids(content) == comments[:COMMENTS_TO_SHOW], (
+        "Убедитесь, что на странице публикации выводится только первая"
+        " страница комментариев, от старых к новым."
+    )
+
+    loaded = comments[:COMMENTS_TO_SHOW]
+    while True:
+        more = MORE_RE.search(content)
+        if not more:
+            break
+        response = client.get(more.group(1).replace("&amp;", "&"))
+        assert response.status_code == 200
+        content = response.content.decode("utf-8")
+        assert "<html" not in content, (
+            "Убедитесь, что следующие комментарии загружаются"
+            " фрагментом страницы."
+        )
+        loaded += _comment_ids(content)
+    assert loaded == comments
+
+    assert client.get(
+        f"/posts/{post.pk}/comments/", {"cursor": "broken"}
+    ).status_code == 404
+
+
+def test_first_page_of_comments_costs_the_same(
+        mixer: Mixer, post_with_published_location, client
+):
+    post = post_with_published_location
+
+    def queries() -> int:
+        with CaptureQueriesContext(connection) as ctx:
+            client.get(f"/posts/{post.pk}/")
+        return len(ctx.captured_queries)
+
+    _add_comments(mixer, post, 5)
+    few = queries()
+    _add_comments(mixer, post, 100)
+    assert queries() == few, (
+        "Убедитесь, что комментарии авторов загружаются"
+        " вместе с комментариями, а не по одному."
+    )
+
+
+def test_comments_of_hidden_post_are_not_loaded(
+        mixer: Mixer, post_with_published_location, client, user_client
+):
+    post = post_with_published_location
+    _add_comments(mixer, post, 1)
+    post.is_published = False
+    post.save()
+    assert client.get(f"/posts/{post.pk}/comments/").status_code == 404
+    assert user_client.get(f"/posts/{post.pk}/comments/").status_code == 200
+
+
+def test_comment_threads(
+        mixer: Mixer, post_with_published_location, user_client, monkeypatch
+):
+    from blog.models import Comment
+    from blog.views import CommentsPageMixin
+    from core.constants import COMMENT_MAX_DEPTH
+
+    post = post_with_published_location
+
+    def reply(parent=None) -> Comment:
+        data = {"text": "Ответ"}
+        if parent is not None:
+            data["parent"] = parent.pk
+        response = user_client.post(f"/posts/{post.pk}/comment/", data)
+        assert response.status_code == 302
+        return Comment.objects.latest("pk")
+
+    first, second, third = reply(), reply(), reply()
+    chain = [second]
+    for _ in range(COMMENT_MAX_DEPTH + 1):
+        chain.append(reply(chain[-1]))
+    assert [comment.depth for comment in chain] == (
+        list(range(COMMENT_MAX_DEPTH + 1)) + [COMMENT_MAX_DEPTH]
+    ), "Убедитесь, что глубина ветки комментариев ограничена."
+    assert chain[-1].parent == chain[-3]
+    late = reply(first)
+
+    monkeypatch.setattr(CommentsPageMixin, "comments_per_page", 2)
+    content = user_client.get(f"/posts/{post.pk}/").content.decode("utf-8")
+    assert _comment_ids(content) == (
+        [first.pk, late.pk] + [comment.pk for comment in chain]
+    ), (
+        "Убедитесь, что ответы выводятся сразу под комментарием,"
+        " на который отвечают."
+    )
+    more = MORE_RE.search(content).group(1).replace("&amp;", "&")
+    content = user_client.get(more).content.decode("utf-8")
+    assert _comment_ids(content) == [third.pk]
+
+    assert user_client.post(
+        f"/posts/{post.pk}/comment/", {"text": "x", "parent": "x"}
+    ).status_code == 404
+    other = mixer.blend("blog.Comment")
+    assert user_client.post(
+        f"/posts/{post.pk}/comment/", {"text": "x", "parent": other.pk}
+    ).status_code == 404
+
+
+def test_comment_pages_do_not_rely_on_byte_order(
+        mixer: Mixer, post_with_published_location, client, monkeypatch
+):
+    from blog.views import CommentsPageMixin
+
+    post = post_with_published_location
+    threads, paths = [], []
+    for _ in range(3):
+        thread = mixer.blend("blog.Comment", post=post, text=mixer.RANDOM)
+        reply = mixer.blend(
+            "blog.Comment", post=post, parent=thread, text=mixer.RANDOM
+        )
+        threads.append([thread.pk, reply.pk])
+        paths.append(thread.path)
+
+    monkeypatch.setattr(CommentsPageMixin, "comments_per_page", 1)
+    content = client.get(f"/posts/{post.pk}/").content.decode("utf-8")
+    pages = [_comment_ids(content)]
+    while MORE_RE.search(content):
+        more = MORE_RE.search(content).group(1).replace("&amp;", "&")
+        with CaptureQueriesContext(connection) as ctx:
+            content = client.get(more).content.decode("utf-8")
+        pages.append(_comment_ids(content))
+        sql = " ".join(query["sql"] for query in ctx.captured_queries)
+        # Sentinels like ':' or 'path0' hold for bytes order only,
+        # not for locale collations of PostgreSQL.
+        assert "':'" not in sql and not any(
+            f"'{path}0'" in sql for path in paths
+        ), (
+            "Убедитесь, что границы страниц комментариев"
+            " не зависят от порядка сортировки строк в базе данных."
+        )
+    assert pages == threads, (
+        "Убедитесь, что ветка комментариев целиком выводится"
+        " на одной странице, без повторов на следующей."
+    )
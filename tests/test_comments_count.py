@@ -0,0 +1,30 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from mixer.backend.django import Mixer
+
+from blog.models import Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_comments_count_is_maintained(
+        mixer: Mixer, post_with_published_location
+):
+    post = post_with_published_location
+    comments = mixer.cycle(3).blend("blog.Comment", post=post)
+    comments[0].delete()
+    post.refresh_from_db()
+    assert post.comments_count == 2, (
+        "Убедитесь, что счётчик комментариев публикации обновляется"
+        " при добавлении и удалении комментариев."
+    )
+
+    Post.objects.filter(pk=post.pk).update(comments_count=100)
+    call_command("recount_comments", stdout=StringIO())
+    post.refresh_from_db()
+    assert post.comments_count == 2, (
+        "Убедитесь, что команда `recount_comments` исправляет"
+        " расхождения счётчика комментариев."
+    )
@@ -0,0 +1,130 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _get(client, url: str, **headers):
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(url, **headers)
+    return response, len(ctx.captured_queries)
+
+
+def _revalidate(client, url: str, response):
+    return _get(client, url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+
+def test_pages_answer_conditional_get(
+        mixer: Mixer, post_with_published_location, client
+):
+    post = post_with_published_location
+    urls = (
+        "/",
+        f"/posts/{post.pk}/",
+        f"/category/{post.category.slug}/",
+        f"/profile/{post.author.username}/",
+    )
+    for url in urls:
+        response = client.get(url)
+        assert response["ETag"].startswith('W/"'), (
+            "Убедитесь, что страницы блога отдают слабый ETag."
+        )
+        assert "Last-Modified" in response
+        assert "no-cache" in response["Cache-Control"]
+
+        not_modified, _ = _revalidate(client, url, response)
+        assert not_modified.status_code == 304, (
+            "Убедитесь, что на запрос с совпадающим If-None-Match"
+            " возвращается ответ 304."
+        )
+        assert not not_modified.content
+        assert client.get(
+            url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        ).status_code == 304
+
+    response = client.get(f"/posts/{post.pk}/")
+    mixer.blend("blog.Comment", post=post)
+    assert _revalidate(
+        client, f"/posts/{post.pk}/", response
+    )[0].status_code == 200, (
+        "Убедитесь, что новый комментарий меняет ETag страницы публикации."
+    )
+
+
+def test_not_modified_pages_skip_rendering(
+        post_with_published_location, client
+):
+    post = post_with_published_location
+    from core.cache import page_cache_key
+
+    response = client.get("/")
+    cache.delete(page_cache_key("pages", "/"))
+    not_modified, queries = _revalidate(client, "/", response)
+    assert not_modified.status_code == 304
+    assert queries == 1 and not not_modified.templates, (
+        "Убедитесь, что ответ 304 отдаётся без отрисовки страницы,"
+        " по одному запросу к базе данных."
+    )
+
+    response = client.get(f"/posts/{post.pk}/")
+    not_modified, queries = _revalidate(client, f"/posts/{post.pk}/", response)
+    assert not_modified.status_code == 304 and queries == 1
+
+
+def test_cached_page_is_revalidated_without_queries(
+        post_with_published_location, client
+):
+    response = client.get("/")
+    not_modified, queries = _revalidate(client, "/", response)
+    assert not_modified.status_code == 304
+    assert not_modified["ETag"] == response["ETag"]
+    assert queries == 0, (
+        "Убедитесь, что закешированная страница проверяется"
+        " без запросов к базе данных."
+    )
+
+
+def test_validators_differ_for_users(
+        post_with_published_location, client, user_client
+):
+    post = post_with_published_location
+    anonymous = client.get("/")
+    authenticated = user_client.get("/")
+    assert anonymous["ETag"] != authenticated["ETag"], (
+        "Убедитесь, что ETag страниц различается для анонимных"
+        " и авторизованных пользователей."
+    )
+    assert "private" in authenticated["Cache-Control"]
+    assert "private" not in anonymous["Cache-Control"]
+    assert _revalidate(user_client, "/", anonymous)[0].status_code == 200
+    assert _revalidate(user_client, "/", authenticated)[0].status_code == 304
+
+    post.delete()
+    response, _ = _revalidate(user_client, "/", authenticated)
+    assert response.status_code == 200, (
+        "Убедитесь, что удаление публикации меняет ETag страниц."
+    )
+
+
+def test_validators_change_with_session(
+        post_with_published_location, client, django_user_model
+):
+    post = post_with_published_location
+    django_user_model.objects.create_user("reader", password="Secret-123")
+    assert client.login(username="reader", password="Secret-123")
+    response = client.get(f"/posts/{post.pk}/")
+    assert _revalidate(
+        client, f"/posts/{post.pk}/", response
+    )[0].status_code == 304
+
+    client.logout()
+    assert client.login(username="reader", password="Secret-123")
+    assert _revalidate(
+        client, f"/posts/{post.pk}/", response
+    )[0].status_code == 200, (
+        "Убедитесь, что после нового входа страницы с формами"
+        " не отдаются из кеша браузера со старым CSRF-токеном."
+    )
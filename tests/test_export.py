@@ -0,0 +1,20 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_export_posts_streams_published(
+        blend_posts, user, published_category, future_posts, tmp_path
+):
+    blend_posts(5, author=user, category=published_category)
+    output = tmp_path / "posts.jsonl"
+    call_command(
+        "export_posts", output=str(output), chunk_size=2, stderr=StringIO(),
+    )
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    assert len(rows) == 5
+    assert {row["category__slug"] for row in rows} == {published_category.slug}
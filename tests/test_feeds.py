@@ -0,0 +1,157 @@
+from xml.etree import ElementTree
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+pytestmark = [pytest.mark.django_db]
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+
+
+def _rss_links(client, url: str, **extra) -> list:
+    response = client.get(url, **extra)
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("application/rss+xml")
+    channel = ElementTree.fromstring(response.content).find("channel")
+    return [item.findtext("link") for item in channel.iter("item")]
+
+
+def _post_links(posts) -> set:
+    return {f"http://testserver/posts/{post.pk}/" for post in posts}
+
+
+def test_feeds_show_published_posts(
+        blend_posts, user, another_user, published_category, client
+):
+    own = blend_posts(3, author=user, category=published_category)
+    other = blend_posts(2, author=another_user)
+    blend_posts(
+        1, is_published=False, author=user, category=published_category
+    )
+
+    assert set(_rss_links(client, "/feeds/rss/")) == _post_links(
+        own + other
+    ), "Убедитесь, что в ленту попадают только опубликованные публикации."
+    assert set(_rss_links(
+        client, f"/category/{published_category.slug}/rss/"
+    )) == _post_links(own), (
+        "Убедитесь, что лента категории содержит только её публикации."
+    )
+    assert set(_rss_links(
+        client, f"/profile/{another_user.username}/rss/"
+    )) == _post_links(other), (
+        "Убедитесь, что лента автора содержит только его публикации."
+    )
+
+    response = client.get("/feeds/atom/")
+    assert response["Content-Type"].startswith("application/atom+xml")
+    entries = ElementTree.fromstring(response.content).findall(
+        f"{ATOM}entry"
+    )
+    assert len(entries) == 5
+
+    assert client.get("/category/missing/rss/").status_code == 404
+    assert client.get("/profile/missing/atom/").status_code == 404
+    published_category.is_published = False
+    published_category.save()
+    assert client.get(
+        f"/category/{published_category.slug}/atom/"
+    ).status_code == 404
+
+
+def test_feeds_are_cached_and_revalidated(
+        blend_posts, user, published_category, client
+):
+    blend_posts(2, author=user, category=published_category)
+    response = client.get("/feeds/rss/")
+    assert "Last-Modified" in response
+
+    with CaptureQueriesContext(connection) as ctx:
+        not_modified = client.get(
+            "/feeds/rss/", HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        cached = client.get("/feeds/rss/")
+    assert not_modified.status_code == 304
+    assert not not_modified.content
+    assert cached.content == response.content
+    assert not ctx.captured_queries, (
+        "Убедитесь, что закешированная лента отдаётся"
+        " без запросов к базе данных."
+    )
+    assert client.get(
+        "/feeds/rss/", HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+    ).status_code == 304
+
+    post = blend_posts(1, author=user, category=published_category)[0]
+    changed = client.get("/feeds/rss/", HTTP_IF_NONE_MATCH=response["ETag"])
+    assert changed.status_code == 200
+    assert f"/posts/{post.pk}/" in changed.content.decode("utf-8"), (
+        "Убедитесь, что новая публикация сразу попадает в ленту."
+    )
+
+    post.title = "Новый заголовок"
+    post.save()
+    assert "Новый заголовок" in client.get(
+        "/feeds/rss/"
+    ).content.decode("utf-8")
+    post.delete()
+    assert f"/posts/{post.pk}/" not in client.get(
+        "/feeds/rss/"
+    ).content.decode("utf-8")
+
+
+def test_pages_link_their_feeds(post_with_published_location, client):
+    post = post_with_published_location
+    pages = {
+        "/": "/feeds/atom/",
+        f"/category/{post.category.slug}/": (
+            f"/category/{post.category.slug}/atom/"
+        ),
+        f"/profile/{post.author.username}/": (
+            f"/profile/{post.author.username}/atom/"
+        ),
+    }
+    for url, feed in pages.items():
+        assert f'href="{feed}"' in client.get(url).content.decode("utf-8"), (
+            "Убедитесь, что страницы ссылаются на свои ленты"
+            " через <link rel=\"alternate\">."
+        )
+
+
+def test_feed_authors(
+        blend_posts, django_user_model, published_category, client
+):
+    author = django_user_model.objects.create_user(
+        "nameless", first_name="", last_name=""
+    )
+    blend_posts(1, author=author, category=published_category)
+    feed = ElementTree.fromstring(
+        client.get("/profile/nameless/atom/").content
+    )
+    assert feed.findtext(f"{ATOM}title") == "Блогикум: nameless"
+    entry = feed.find(f"{ATOM}entry")
+    assert entry.findtext(f"{ATOM}author/{ATOM}name") == "nameless", (
+        "Убедитесь, что для авторов без имени в ленте выводится логин."
+    )
+    assert entry.findtext(f"{ATOM}author/{ATOM}uri") == (
+        "http://testserver/profile/nameless/"
+    ), "Убедитесь, что ссылки на авторов в ленте абсолютные."
+
+
+def test_feed_is_cached_per_scheme_and_host(
+        blend_posts, user, published_category, client, settings
+):
+    settings.ALLOWED_HOSTS = ["testserver", "mirror.example"]
+    post = blend_posts(1, author=user, category=published_category)[0]
+    assert _rss_links(client, "/feeds/rss/") == [
+        f"http://testserver/posts/{post.pk}/"
+    ]
+    assert _rss_links(client, "/feeds/rss/", secure=True) == [
+        f"https://testserver/posts/{post.pk}/"
+    ], "Убедитесь, что лента по https закеширована отдельно от http."
+    assert _rss_links(
+        client, "/feeds/rss/", HTTP_HOST="mirror.example"
+    ) == [f"http://mirror.example/posts/{post.pk}/"], (
+        "Убедитесь, что лента для каждого хоста закеширована отдельно."
+    )
@@ -0,0 +1,114 @@
+import re
+from datetime import datetime, timedelta
+from io import BytesIO
+
+import pytest
+import pytz
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _upload(name: str, size=(2000, 1000)) -> SimpleUploadedFile:
+    content = BytesIO()
+    Image.new("RGB", size, "orange").save(content, "JPEG")
+    return SimpleUploadedFile(name, content.getvalue(), "image/jpeg")
+
+
+@pytest.fixture
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    return tmp_path
+
+
+@pytest.fixture
+def post_with_image(media_root, user, published_category):
+    from blog.models import Post
+
+    return Post.objects.create(
+        title="С картинкой", text="text", author=user,
+        category=published_category, image=_upload("photo.jpg"),
+        pub_date=datetime.now(tz=pytz.UTC) - timedelta(days=1),
+    )
+
+
+def test_post_image_variants(post_with_image, media_root, client):
+    from blog.images import process_post_image
+
+    post = post_with_image
+    assert post.image_variants == {}
+    assert process_post_image(post.pk)
+    post.refresh_from_db()
+
+    for variant, width in (("card", 640), ("detail", 1280)):
+        for image_format in ("jpeg", "webp"):
+            with Image.open(
+                media_root / post.image_variants[variant][image_format]
+            ) as image:
+                assert image.format == image_format.upper()
+                assert image.size == (width, width // 2), (
+                    "Убедитесь, что для иллюстраций публикаций создаются"
+                    " уменьшенные копии в форматах JPEG и WebP."
+                )
+
+    for url in ("/", f"/posts/{post.pk}/"):
+        content = client.get(url).content.decode("utf-8")
+        assert 'type="image/webp"' in content and " 640w" in content, (
+            "Убедитесь, что иллюстрации публикаций выводятся"
+            " с уменьшенными копиями в srcset."
+        )
+
+    post.image = _upload("other.jpg")
+    post.save()
+    assert post.image_variants == {}, (
+        "Убедитесь, что копии сбрасываются при замене иллюстрации."
+    )
+
+
+def test_post_image_is_processed_by_worker(
+        media_root, user_client, published_category
+):
+    from io import StringIO
+
+    from django.core.management import call_command
+
+    from blog.models import Post
+    from core.models import Job
+
+    content = BytesIO()
+    exif = Image.Exif()
+    exif[0x010F] = "Camera maker"
+    Image.new("RGB", (800, 600)).save(content, "JPEG", exif=exif)
+    response = user_client.post("/posts/create/", {
+        "title": "Новая", "text": "text",
+        "pub_date": "2020-01-01T10:00",
+        "category": published_category.pk,
+        "image": SimpleUploadedFile(
+            "new.jpg", content.getvalue(), "image/jpeg"
+        ),
+    })
+    assert response.status_code == 302
+    post = Post.objects.get()
+    assert post.image_variants == {}, (
+        "Убедитесь, что иллюстрации обрабатываются вне обработки запроса."
+    )
+    assert Job.objects.get().status == Job.QUEUED
+
+    call_command("runworker", "--once", stdout=StringIO(), stderr=StringIO())
+    assert Job.objects.get().status == Job.DONE
+    post.refresh_from_db()
+    assert set(post.image_variants) == {"card", "detail"}
+    with Image.open(media_root / post.image.name) as image:
+        assert not image.getexif(), (
+            "Убедитесь, что из иллюстраций удаляются данные EXIF."
+        )
+    assert not (media_root / "post_images" / "new.jpg").exists()
+    assert re.fullmatch(
+        r"post_images/\w\w/\w\w/\w{64}\.jpg", post.image.name
+    ), "Убедитесь, что обработанная иллюстрация не шардируется повторно."
+    assert all(
+        re.fullmatch(r"post_images/variants/\w\w/\w\w/\w{64}\.\w+", name)
+        for formats in post.image_variants.values()
+        for name in formats.values() if isinstance(name, str)
+    ), "Убедитесь, что копии всех иллюстраций лежат в одном каталоге."
@@ -0,0 +1,140 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+pytestmark = [pytest.mark.django_db]
+
+calls = []
+
+
+@pytest.fixture
+def flaky_job():
+    from core.jobs import _registry, register_job
+
+    calls.clear()
+
+    @register_job("tests.flaky")
+    def flaky(fail_times: int):
+        calls.append(fail_times)
+        if len(calls) <= fail_times:
+            raise RuntimeError("Temporary failure")
+
+    yield "tests.flaky"
+    _registry.pop("tests.flaky")
+
+
+def _run_due(job):
+    from core.jobs import run_next_job
+    from core.models import Job
+
+    # Skip retry delay.
+    Job.objects.filter(pk=job.pk).update(run_after=timezone.now())
+    return run_next_job()
+
+
+def test_failed_job_is_retried(flaky_job):
+    from core.jobs import enqueue, run_next_job
+    from core.models import Job
+
+    job = enqueue(flaky_job, fail_times=1)
+    assert run_next_job() is False
+    job.refresh_from_db()
+    assert job.status == Job.QUEUED and job.attempts == 1
+    assert "Temporary failure" in job.error
+    assert job.run_after > timezone.now()
+    assert run_next_job() is None, (
+        "Убедитесь, что повтор задачи откладывается."
+    )
+
+    assert _run_due(job) is True
+    job.refresh_from_db()
+    assert job.status == Job.DONE and job.attempts == 2, (
+        "Убедитесь, что упавшая задача выполняется повторно."
+    )
+
+
+def test_job_fails_after_last_attempt(flaky_job):
+    from core.constants import JOB_MAX_ATTEMPTS
+    from core.jobs import enqueue
+    from core.models import Job
+
+    job = enqueue(flaky_job, fail_times=JOB_MAX_ATTEMPTS)
+    for _ in range(JOB_MAX_ATTEMPTS):
+        assert _run_due(job) is False
+    job.refresh_from_db()
+    assert job.status == Job.FAILED and len(calls) == JOB_MAX_ATTEMPTS, (
+        "Убедитесь, что задача помечается как упавшая после"
+        " исчерпания попыток."
+    )
+
+
+def test_lost_job_is_requeued(flaky_job):
+    from core.jobs import claim_next_job, enqueue, requeue_lost_jobs
+    from core.models import Job
+
+    enqueue(flaky_job, fail_times=0)
+    job = claim_next_job()
+    assert claim_next_job() is None, (
+        "Убедитесь, что задачу может взять только один обработчик."
+    )
+    Job.objects.filter(pk=job.pk).update(
+        started_at=timezone.now() - timedelta(days=1)
+    )
+    assert requeue_lost_jobs() == 1
+    assert claim_next_job().pk == job.pk
+
+
+def test_lost_job_fails_after_last_attempt(flaky_job):
+    from core.constants import JOB_MAX_ATTEMPTS
+    from core.jobs import enqueue, requeue_lost_jobs
+    from core.models import Job
+
+    job = enqueue(flaky_job, fail_times=0)
+    Job.objects.filter(pk=job.pk).update(
+        status=Job.RUNNING,
+        attempts=JOB_MAX_ATTEMPTS,
+        started_at=timezone.now() - timedelta(days=1),
+    )
+    assert requeue_lost_jobs() == 0
+    job.refresh_from_db()
+    assert job.status == Job.FAILED, (
+        "Убедитесь, что задача, потерянная на последней попытке,"
+        " не возвращается в очередь."
+    )
+
+
+def test_worker_requeues_lost_jobs_while_running(flaky_job, monkeypatch):
+    from io import StringIO
+
+    from django.core.management import call_command
+
+    from core.jobs import _registry, enqueue, register_job
+    from core.models import Job
+
+    lost = enqueue(flaky_job, fail_times=0)
+    Job.objects.filter(pk=lost.pk).update(
+        status=Job.RUNNING, attempts=1, started_at=timezone.now()
+    )
+
+    @register_job("tests.lose_worker")
+    def lose_worker():
+        # Worker of the running job is killed meanwhile.
+        Job.objects.filter(pk=lost.pk).update(
+            started_at=timezone.now() - timedelta(days=1)
+        )
+
+    monkeypatch.setattr(
+        "core.management.commands.runworker.JOB_REQUEUE_INTERVAL", 0
+    )
+    try:
+        enqueue("tests.lose_worker")
+        call_command("runworker", "--once", stdout=StringIO(),
+                     stderr=StringIO())
+    finally:
+        _registry.pop("tests.lose_worker")
+    lost.refresh_from_db()
+    assert lost.status == Job.DONE, (
+        "Убедитесь, что обработчик периодически возвращает в очередь"
+        " задачи потерянных обработчиков."
+    )
@@ -0,0 +1,83 @@
+import pytest
+from django.db import connection
+from mixer.backend.django import Mixer
+
+from blog.models import Post
+from conftest import N_PER_PAGE, count_queries
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_listing_queries_do_not_grow_with_posts(
+        mixer: Mixer, blend_posts, user, published_category, client
+):
+    def add_posts(n: int):
+        posts = blend_posts(n, author=user, category=published_category)
+        for post in posts:
+            mixer.cycle(2).blend("blog.Comment", post=post)
+
+    urls = (
+        "/",
+        f"/category/{published_category.slug}/",
+        f"/profile/{user.username}/",
+    )
+    add_posts(1)
+    queries_before = [count_queries(client, url) for url in urls]
+    add_posts(N_PER_PAGE)
+    queries_after = [count_queries(client, url) for url in urls]
+    assert queries_before == queries_after, (
+        "Убедитесь, что число запросов к БД на страницах со списком"
+        " публикаций не зависит от количества публикаций и комментариев."
+    )
+
+
+@pytest.mark.parametrize(
+    "client_fixture, n_queries",
+    [
+        # post, comments
+        ("unlogged_client", 2),
+        # session, user, post, comments
+        ("user_client", 4),
+    ],
+)
+def test_post_detail_query_budget(
+        request, mixer: Mixer, post_with_published_location,
+        client_fixture, n_queries
+):
+    post = post_with_published_location
+    mixer.cycle(5).blend("blog.Comment", post=post)
+    client = request.getfixturevalue(client_fixture)
+    assert count_queries(client, f"/posts/{post.id}/") == n_queries, (
+        "Убедитесь, что страница публикации загружает публикацию"
+        " одним запросом вместе со связанными объектами."
+    )
+
+
+@pytest.mark.parametrize(
+    "listing, index_name",
+    [
+        ("feed", "post_visible_pub_date_idx"),
+        ("category", "post_category_visible_idx"),
+        ("profile", "post_author_pub_date_idx"),
+    ],
+)
+def test_listing_queries_use_indexes(
+        user, published_category, listing, index_name
+):
+    if connection.vendor == "postgresql":
+        # Tables are tiny in tests, make planner prefer indexes anyway.
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+    elif connection.vendor != "sqlite":
+        pytest.skip(f"No EXPLAIN check for {connection.vendor}")
+
+    querysets = {
+        "feed": Post.published_posts.all(),
+        "category": published_category.posts(manager="published_posts"),
+        "profile": user.posts(manager="published_posts"),
+    }
+    plan = querysets[listing].order_by("-pub_date")[:N_PER_PAGE].explain()
+    assert index_name in plan, (
+        f"Убедитесь, что запрос публикаций использует индекс {index_name}:"
+        f"\n{plan}"
+    )
@@ -0,0 +1,97 @@
+import hashlib
+
+import pytest
+
+CONTENT = bytes(range(256)) * 4
+DIGEST = hashlib.sha256(CONTENT).hexdigest()
+HASHED = f"post_images/{DIGEST[:2]}/{DIGEST[2:4]}/{DIGEST}.jpg"
+
+
+@pytest.fixture
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    for name in (HASHED, "post_images/plain.jpg"):
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_bytes(CONTENT)
+    return tmp_path
+
+
+def _body(response) -> bytes:
+    return b"".join(response.streaming_content)
+
+
+def test_media_is_served_with_validators(media_root, client):
+    response = client.get(f"/media/{HASHED}")
+    assert response.status_code == 200
+    assert _body(response) == CONTENT
+    assert response["ETag"] == f'"{DIGEST}"'
+    assert "immutable" in response["Cache-Control"], (
+        "Убедитесь, что файлы с хешем содержимого в имени кешируются"
+        " браузером надолго."
+    )
+    assert response["Accept-Ranges"] == "bytes"
+
+    response = client.get(
+        f"/media/{HASHED}", HTTP_IF_NONE_MATCH=f'"{DIGEST}"'
+    )
+    assert response.status_code == 304, (
+        "Убедитесь, что на запрос с совпадающим If-None-Match"
+        " возвращается ответ 304."
+    )
+
+    plain = client.get("/media/post_images/plain.jpg")
+    assert "immutable" not in plain["Cache-Control"]
+    revalidated = client.get(
+        "/media/post_images/plain.jpg", HTTP_IF_NONE_MATCH=plain["ETag"]
+    )
+    assert revalidated.status_code == 304
+
+    for path in ("post_images/missing.jpg", "../secret", "post_images"):
+        assert client.get(f"/media/{path}").status_code == 404
+
+
+@pytest.mark.parametrize("header, status, content_range", [
+    ("bytes=0-9", 206, "bytes 0-9/1024"),
+    ("bytes=1000-", 206, "bytes 1000-1023/1024"),
+    ("bytes=-24", 206, "bytes 1000-1023/1024"),
+    ("bytes=1000-5000", 206, "bytes 1000-1023/1024"),
+    ("bytes=0-1,5-6", 200, None),
+    ("bytes=5000-", 416, "bytes */1024"),
+])
+def test_media_range_requests(
+        media_root, client, header, status, content_range
+):
+    response = client.get(f"/media/{HASHED}", HTTP_RANGE=header)
+    assert response.status_code == status, (
+        "Убедитесь, что поддерживаются запросы части файла (Range)."
+    )
+    assert response.get("Content-Range") == content_range
+    if status == 206:
+        first, last = map(int, content_range[6:].split("/")[0].split("-"))
+        assert _body(response) == CONTENT[first:last + 1]
+
+
+def test_media_range_ignored_for_changed_file(media_root, client):
+    response = client.get(
+        f"/media/{HASHED}", HTTP_RANGE="bytes=0-9", HTTP_IF_RANGE='"other"'
+    )
+    assert response.status_code == 200
+    assert _body(response) == CONTENT
+
+
+@pytest.mark.parametrize("mode, header, value", [
+    ("x-accel-redirect", "X-Accel-Redirect", f"/protected-media/{HASHED}"),
+    ("x-sendfile", "X-Sendfile", None),
+])
+def test_media_is_handed_off_to_web_server(
+        media_root, client, settings, mode, header, value
+):
+    settings.MEDIA_SERVE_MODE = mode
+    response = client.get(f"/media/{HASHED}")
+    assert response.status_code == 200
+    assert response.content == b"", (
+        "Убедитесь, что при передаче файла веб-серверу Django"
+        " не отправляет его содержимое."
+    )
+    assert response[header] == (value or str(media_root / HASHED))
+    assert response["ETag"] == f'"{DIGEST}"'
@@ -0,0 +1,62 @@
+import pytest
+from mixer.backend.django import Mixer
+
+from blog.models import Post
+from conftest import count_queries
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_anonymous_pages_are_cached(
+        mixer: Mixer, post_with_published_location, client, user_client
+):
+    post = post_with_published_location
+    urls = (
+        "/",
+        f"/category/{post.category.slug}/",
+        f"/profile/{post.author.username}/",
+    )
+    for url in urls:
+        count_queries(client, url)
+        assert count_queries(client, url) == 0, (
+            "Убедитесь, что страницы со списком публикаций кешируются"
+            " для анонимных пользователей."
+        )
+        assert count_queries(user_client, url) > 0
+        assert count_queries(client, f"{url}?utm_source=feed") == 0, (
+            "Убедитесь, что посторонние параметры запроса"
+            " не создают новых записей в кеше страниц."
+        )
+    assert count_queries(client, "/?page=1") > 0
+
+    mixer.cycle(3).blend("blog.Comment", post=post)
+    for url in urls:
+        assert "(3)" in client.get(url).content.decode("utf-8"), (
+            "Убедитесь, что кеш страниц сбрасывается при добавлении"
+            " комментариев."
+        )
+
+
+def test_post_cards_are_cached_by_version(
+        post_with_published_location, user_client
+):
+    post = post_with_published_location
+    assert post.title in user_client.get("/").content.decode("utf-8")
+
+    # Bypasses signals, so cached card is still in use.
+    Post.objects.filter(pk=post.pk).update(title="Stale title")
+    assert post.title in user_client.get("/").content.decode("utf-8"), (
+        "Убедитесь, что карточки публикаций кешируются."
+    )
+
+    post.title = "Fresh title"
+    post.save()
+    assert "Fresh title" in user_client.get("/").content.decode("utf-8"), (
+        "Убедитесь, что кеш карточки сбрасывается при изменении публикации."
+    )
+
+    post.category.title = "Fresh category"
+    post.category.save()
+    assert "Fresh category" in user_client.get("/").content.decode("utf-8"), (
+        "Убедитесь, что кеш карточки сбрасывается при изменении категории."
+    )
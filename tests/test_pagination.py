@@ -0,0 +1,76 @@
+import pytest
+from django.test import override_settings
+from mixer.backend.django import Mixer
+
+from blog.models import Post
+from conftest import N_PER_PAGE, count_queries
+
+pytestmark = [pytest.mark.django_db]
+
+
+@override_settings(POSTS_CURSOR_PAGINATION=True)
+def test_cursor_pagination_walks_feed(
+        mixer: Mixer, blend_posts, user, published_category, client
+):
+    posts = blend_posts(
+        N_PER_PAGE * 2, author=user, category=published_category
+    )
+    # Posts sharing pub_date must be split between pages consistently.
+    mixer.cycle(3).blend(
+        "blog.Post", is_published=True, pub_date=posts[N_PER_PAGE].pub_date,
+        author=user, category=published_category,
+    )
+    expected = list(
+        Post.objects.order_by("-pub_date", "-pk").values_list("pk", flat=True)
+    )
+
+    seen, pages, url = [], [], "/"
+    while url:
+        page = client.get(url).context["page_obj"]
+        pages.append(page)
+        seen.extend(post.pk for post in page)
+        url = f"/?cursor={page.next_cursor}" if page.has_next() else None
+    assert seen == expected, (
+        "Убедитесь, что постраничный вывод по курсору показывает все"
+        " публикации ровно один раз в порядке убывания даты публикации."
+    )
+
+    previous = client.get(f"/?cursor={pages[-1].previous_cursor}")
+    assert (
+        [post.pk for post in previous.context["page_obj"]]
+        == [post.pk for post in pages[-2]]
+    )
+    assert client.get("/?cursor=broken").status_code == 404
+
+
+def test_paginator_count_is_cached(
+        blend_posts, user, published_category, user_client
+):
+    client = user_client
+    blend_posts(N_PER_PAGE * 2, author=user, category=published_category)
+    first = count_queries(client, "/?page=2")
+    assert count_queries(client, "/?page=2") == first - 1, (
+        "Убедитесь, что общее число публикаций для постраничного вывода"
+        " кешируется между запросами."
+    )
+
+    blend_posts(N_PER_PAGE, author=user, category=published_category)
+    page_obj = client.get("/?page=2").context["page_obj"]
+    assert page_obj.paginator.count == N_PER_PAGE * 3, (
+        "Убедитесь, что кеш числа публикаций сбрасывается"
+        " при добавлении публикаций."
+    )
+
+
+def test_paginator_page_window(
+        blend_posts, user, published_category, client
+):
+    blend_posts(
+        N_PER_PAGE * 15, author=user, category=published_category
+    )
+    content = client.get("/?page=8").content.decode("utf-8")
+    assert "?page=15" in content and "?page=11" in content
+    assert "?page=2\"" not in content and "?page=13\"" not in content, (
+        "Убедитесь, что постраничный вывод показывает только ближайшие"
+        " к текущей страницы."
+    )
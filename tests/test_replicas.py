@@ -0,0 +1,101 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from django.test import override_settings
+
+# Runs with primary and replica in separate SQLite files.
+# Replica is migrated but never receives data, like a lagging one.
+HARNESS_SCRIPT = """
+import django
+django.setup()
+
+from django.contrib.auth import get_user_model
+from django.test import Client
+from django.utils import timezone
+
+from blog.models import Category, Post
+
+user = get_user_model().objects.create_user("reader", password="Secret-123")
+category = Category.objects.create(title="c", slug="c", description="c")
+Post.objects.create(
+    title="Only on primary", text="text", pub_date=timezone.now(),
+    author=user, category=category,
+)
+
+client = Client(HTTP_HOST="localhost")
+content = client.get("/").content.decode("utf-8")
+assert "Only on primary" not in content, "Feed was not read from replica"
+
+response = client.post(
+    "/auth/login/", {"username": "reader", "password": "Secret-123"}
+)
+assert response.status_code == 302, "Login failed"
+assert "use_primary" in response.cookies, "Client was not pinned to primary"
+
+content = client.get("/").content.decode("utf-8")
+assert "Only on primary" in content, "Pinned client did not read primary"
+"""
+
+
+@pytest.mark.django_db
+def test_reads_go_to_replica_until_client_writes(tmp_path):
+    from django.conf import settings
+
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": "blogicum.settings",
+        "BLOGICUM_DB_NAME": str(tmp_path / "primary.sqlite3"),
+        "BLOGICUM_DB_REPLICAS": str(tmp_path / "replica.sqlite3"),
+    }
+
+    def run(*args):
+        return subprocess.run(
+            [sys.executable, *args],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+        )
+
+    assert run("manage.py", "migrate", "-v0").returncode == 0
+    assert run(
+        "manage.py", "migrate", "-v0", "--database", "replica1"
+    ).returncode == 0
+    result = run("-c", HARNESS_SCRIPT)
+    assert result.returncode == 0, (
+        "Убедитесь, что чтение без записи идёт в реплику, а после записи"
+        f" клиент читает из основной базы:\n{result.stderr}"
+    )
+
+
+@override_settings(DATABASE_REPLICAS=["replica1"])
+def test_router_uses_replica_only_for_marked_reads():
+    from core.routers import PrimaryReplicaRouter, read_from_replica
+
+    router = PrimaryReplicaRouter()
+    assert router.db_for_read(None) == "default"
+    token = read_from_replica.set(True)
+    try:
+        assert router.db_for_read(None) == "replica1"
+        assert router.db_for_write(None) == "default"
+    finally:
+        read_from_replica.reset(token)
+
+
+def test_prod_replicas_keep_connections(tmp_path):
+    from django.conf import settings
+
+    result = subprocess.run(
+        [sys.executable, "-c", (
+            "from blogicum.settings import prod;"
+            "print(prod.DATABASES['replica1']['CONN_MAX_AGE'])"
+        )],
+        cwd=settings.BASE_DIR, capture_output=True, text=True, env={
+            **os.environ,
+            "BLOGICUM_DB_REPLICAS": str(tmp_path / "replica.sqlite3"),
+        },
+    )
+    assert result.returncode == 0, result.stderr
+    assert int(result.stdout) > 0, (
+        "Убедитесь, что в продакшене соединения с репликами"
+        " тоже остаются открытыми между запросами."
+    )
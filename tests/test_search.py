@@ -0,0 +1,196 @@
+from datetime import timedelta
+
+import pytest
+from mixer.backend.django import Mixer
+
+from conftest import N_PER_PAGE
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _found(client, query: str) -> list:
+    response = client.get("/search/", {"q": query})
+    assert response.status_code == 200
+    return [post.pk for post in response.context["page_obj"]]
+
+
+def test_search_is_ranked_stemmed_and_respects_visibility(
+        mixer: Mixer, blend_posts, user, published_category, client
+):
+    in_text, = blend_posts(
+        1, title="Заметки", text="Во дворе гуляла кошка.",
+        author=user, category=published_category,
+    )
+    in_title, = blend_posts(
+        1, title="Наши кошки", text="Про домашних животных.",
+        author=user, category=published_category,
+    )
+    blend_posts(
+        1, title="Кошки", text="Черновик", is_published=False,
+        author=user, category=published_category,
+    )
+    assert _found(client, "кошками") == [in_title.pk, in_text.pk], (
+        "Убедитесь, что поиск находит разные формы слова, ставит выше"
+        " совпадения в заголовке и не показывает скрытые публикации."
+    )
+
+    mixer.blend("blog.Comment", post=in_text, text="Видел там собак")
+    assert _found(client, "собака") == [in_text.pk], (
+        "Убедитесь, что поиск учитывает комментарии к публикациям."
+    )
+    assert _found(client, '"*') == []
+
+
+def _run_jobs():
+    from core.jobs import run_next_job
+
+    while run_next_job() is not None:
+        pass
+
+
+def test_new_comment_is_indexed_alone(
+        mixer: Mixer, post_with_published_location, client, monkeypatch
+):
+    from core.models import Job
+
+    post = post_with_published_location
+    mixer.cycle(3).blend("blog.Comment", post=post, text="Старый лес")
+    _run_jobs()
+
+    def reindex_post(*args, **kwargs):
+        raise AssertionError("Post is reindexed")
+
+    monkeypatch.setattr("blog.signals.reindex_post", reindex_post)
+    monkeypatch.setattr("blog.search.reindex_post", reindex_post)
+    mixer.blend("blog.Comment", post=post, text="Тихая речка")
+    assert _found(client, "речка") == [post.pk], (
+        "Убедитесь, что новый комментарий добавляется в поисковый индекс"
+        " без переиндексации остальных комментариев публикации."
+    )
+    assert _found(client, "лес") == [post.pk]
+    assert not Job.objects.filter(name="blog.reindex_post").exists()
+
+    for comment in post.comments.all():
+        comment.delete()
+    assert Job.objects.filter(
+        name="blog.reindex_post", status=Job.QUEUED
+    ).count() == 1, (
+        "Убедитесь, что удаление комментариев ставит в очередь"
+        " одну переиндексацию публикации."
+    )
+
+
+def test_index_changes_keep_listing_counts(
+        mixer: Mixer, post_with_published_location
+):
+    from core.cache import get_generation
+
+    posts = get_generation("posts")
+    mixer.blend("blog.Comment", post=post_with_published_location)
+    assert get_generation("posts") == posts, (
+        "Убедитесь, что изменения поискового индекса не сбрасывают"
+        " закешированные количества публикаций."
+    )
+
+
+def test_search_index_follows_changes(
+        mixer: Mixer, post_with_published_location, client
+):
+    post = post_with_published_location
+    post.title = "Путешествие на Байкал"
+    post.save()
+    assert _found(client, "байкал") == [post.pk]
+
+    post.title = "Путешествие на Алтай"
+    post.save()
+    assert _found(client, "байкал") == [], (
+        "Убедитесь, что поисковый индекс обновляется при изменении"
+        " публикации."
+    )
+
+    comment = mixer.blend("blog.Comment", post=post, text="Чудесные озёра")
+    assert _found(client, "озеро") == [post.pk]
+    comment.text = "Чудесные горы"
+    comment.save()
+    _run_jobs()
+    assert _found(client, "гора") == [post.pk]
+    assert _found(client, "озеро") == [], (
+        "Убедитесь, что изменённые комментарии переиндексируются."
+    )
+    comment.delete()
+    _run_jobs()
+    assert _found(client, "гора") == []
+
+    post.delete()
+    assert _found(client, "алтай") == [], (
+        "Убедитесь, что удалённые публикации пропадают из поиска."
+    )
+
+
+def test_search_pages_keep_query(
+        blend_posts, user, published_category, client
+):
+    blend_posts(
+        N_PER_PAGE + 1, title="Горы",
+        author=user, category=published_category,
+    )
+    content = client.get("/search/", {"q": "горы"}).content.decode("utf-8")
+    assert "?q=%D0%B3%D0%BE%D1%80%D1%8B&amp;page=2" in content, (
+        "Убедитесь, что ссылки постраничного вывода результатов поиска"
+        " сохраняют поисковый запрос."
+    )
+    page = client.get("/search/", {"q": "горы", "page": 2})
+    assert len(page.context["page_obj"]) == 1
+
+
+def test_rebuild_search_index_in_bulk(
+        blend_posts, user, published_category, client
+):
+    from io import StringIO
+
+    from django.core.management import call_command
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from django.utils import timezone
+
+    from blog.models import Post
+
+    def rebuild(*args) -> str:
+        stdout = StringIO()
+        call_command(
+            "rebuild_search_index", *args, stdout=stdout, stderr=StringIO()
+        )
+        return stdout.getvalue()
+
+    def drop_index():
+        # Like posts loaded with loaddata, which skips signals.
+        with connection.cursor() as cursor:
+            cursor.execute("DELETE FROM blog_post_search")
+
+    def queries_to_rebuild(n_posts: int) -> int:
+        blend_posts(
+            n_posts, title="Тайга", author=user, category=published_category
+        )
+        drop_index()
+        with CaptureQueriesContext(connection) as ctx:
+            rebuild("--chunk-size", "50")
+        return len(ctx.captured_queries)
+
+    assert queries_to_rebuild(2) == queries_to_rebuild(20), (
+        "Убедитесь, что команда `rebuild_search_index` индексирует"
+        " публикации пачками, а не по одной."
+    )
+    response = client.get("/search/", {"q": "тайга"})
+    assert response.context["paginator"].count == 22
+
+    first, second = Post.objects.order_by("pk")[:2]
+    Post.objects.filter(pk=first.pk).update(
+        title="Тундра", updated_at=timezone.now() + timedelta(seconds=1)
+    )
+    # Not marked as changed, so incremental rebuild skips it.
+    Post.objects.filter(pk=second.pk).update(title="Тундра")
+    assert rebuild("--incremental").startswith("Indexed 1 posts"), (
+        "Убедитесь, что команда `rebuild_search_index --incremental`"
+        " индексирует только изменённые публикации."
+    )
+    assert _found(client, "тундра") == [first.pk]
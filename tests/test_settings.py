@@ -0,0 +1,15 @@
+from blogicum.settings import base, prod
+
+
+def test_prod_settings_profile():
+    assert not prod.DEBUG
+    assert "debug_toolbar" not in prod.INSTALLED_APPS
+    assert not any("debug_toolbar" in m for m in prod.MIDDLEWARE), (
+        "Убедитесь, что в настройках для продакшена нет debug_toolbar."
+    )
+    assert prod.DATABASES["default"]["CONN_MAX_AGE"] > 0
+    assert not base.DATABASES["default"].get("CONN_MAX_AGE"), (
+        "Убедитесь, что настройки для продакшена не меняют"
+        " настройки базы данных других профилей."
+    )
+    assert "cached" in prod.SESSION_ENGINE
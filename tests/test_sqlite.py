@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from django.conf import settings
+from django.db import connection
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_sqlite_connection_pragmas():
+    if connection.vendor != "sqlite":
+        pytest.skip("SQLite only")
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA synchronous")
+        synchronous = cursor.fetchone()[0]
+        cursor.execute("PRAGMA busy_timeout")
+        busy_timeout = cursor.fetchone()[0]
+    assert synchronous == 1 and busy_timeout > 0, (
+        "Убедитесь, что для соединений SQLite настроены synchronous=NORMAL"
+        " и busy_timeout."
+    )
+
+
+def test_sqlite_concurrent_comments_and_feed(tmp_path):
+    if connection.vendor != "sqlite":
+        pytest.skip("SQLite only")
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": "blogicum.settings",
+        "BLOGICUM_DB_NAME": str(tmp_path / "stress.sqlite3"),
+    }
+
+    def manage(*args):
+        return subprocess.run(
+            [sys.executable, "manage.py", *args],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+        )
+
+    assert manage("migrate", "-v0").returncode == 0
+    result = manage(
+        "stress_sqlite", "--writers", "4", "--readers", "4", "--seconds", "2"
+    )
+    assert result.returncode == 0, (
+        "Убедитесь, что параллельная запись комментариев и чтение ленты"
+        f" не приводят к блокировке базы данных:\n{result.stderr}"
+    )
@@ -0,0 +1,100 @@
+import os
+from datetime import datetime, timedelta
+from io import BytesIO, StringIO
+
+import pytest
+import pytz
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from PIL import Image
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _upload(name: str, color: str = "orange") -> SimpleUploadedFile:
+    content = BytesIO()
+    Image.new("RGB", (100, 50), color).save(content, "JPEG")
+    return SimpleUploadedFile(name, content.getvalue(), "image/jpeg")
+
+
+def _age(path, seconds: int = 24 * 60 * 60) -> None:
+    old = path.stat().st_mtime - seconds
+    os.utime(path, (old, old))
+
+
+def _files(root) -> list:
+    return sorted(
+        path.relative_to(root).as_posix()
+        for path in root.rglob("*") if path.is_file()
+    )
+
+
+@pytest.fixture
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    return tmp_path
+
+
+@pytest.fixture
+def create_post(media_root, user, published_category):
+    from blog.models import Post
+
+    def create(image: SimpleUploadedFile):
+        return Post.objects.create(
+            title="С картинкой", text="text", author=user,
+            category=published_category, image=image,
+            pub_date=datetime.now(tz=pytz.UTC) - timedelta(days=1),
+        )
+
+    return create
+
+
+def test_identical_uploads_are_stored_once(
+        create_post, media_root, django_capture_on_commit_callbacks
+):
+    first = create_post(_upload("photo.JPG"))
+    second = create_post(_upload("copy.jpg"))
+    name = first.image.name
+    assert name == second.image.name, (
+        "Убедитесь, что одинаковые файлы сохраняются под одним именем."
+    )
+    directory, first_shard, second_shard, filename = name.split("/")
+    digest = filename[:-len(".jpg")]
+    assert filename.endswith(".jpg") and len(digest) == 64
+    assert (first_shard, second_shard) == (digest[:2], digest[2:4])
+    assert _files(media_root) == [name]
+
+    _age(media_root / name)
+    with django_capture_on_commit_callbacks(execute=True):
+        first.delete()
+    assert (media_root / name).exists(), (
+        "Убедитесь, что файл, используемый другой публикацией,"
+        " не удаляется."
+    )
+    with django_capture_on_commit_callbacks(execute=True):
+        second.delete()
+    assert not (media_root / name).exists(), (
+        "Убедитесь, что файл удаляется вместе с последней публикацией,"
+        " которая на него ссылается."
+    )
+    assert not (media_root / directory / first_shard).exists()
+
+
+def test_cleanup_media_removes_orphans(create_post, media_root):
+    post = create_post(_upload("photo.jpg"))
+    recent = create_post(_upload("recent.jpg", "blue")).image.name
+    orphan = create_post(_upload("orphan.jpg", "green")).image.name
+    type(post).objects.exclude(pk=post.pk).update(image="")
+    for name in (post.image.name, orphan):
+        _age(media_root / name)
+
+    stdout = StringIO()
+    call_command("cleanup_media", "--dry-run", stdout=stdout)
+    assert stdout.getvalue().startswith("Would delete 1 files")
+    assert (media_root / orphan).exists()
+
+    call_command("cleanup_media", stdout=StringIO())
+    assert _files(media_root) == sorted([post.image.name, recent]), (
+        "Убедитесь, что команда `cleanup_media` удаляет только давно"
+        " не используемые файлы."
+    )
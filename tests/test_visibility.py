@@ -0,0 +1,39 @@
+from datetime import datetime, timedelta
+from io import StringIO
+
+import pytest
+import pytz
+from django.core.management import call_command
+from mixer.backend.django import Mixer
+
+from blog.models import Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_visible_flag_follows_category_and_clock(
+        mixer: Mixer, user, published_category
+):
+    post = mixer.blend(
+        "blog.Post", is_published=True, author=user,
+        category=published_category,
+        pub_date=datetime.now(tz=pytz.UTC) + timedelta(days=1),
+    )
+    assert not Post.published_posts.filter(pk=post.pk).exists()
+
+    # Clock crosses pub_date, flags are flipped by the scheduler.
+    Post.objects.filter(pk=post.pk).update(
+        pub_date=datetime.now(tz=pytz.UTC) - timedelta(minutes=5)
+    )
+    call_command("publish_scheduled", stdout=StringIO())
+    assert Post.published_posts.filter(pk=post.pk).exists(), (
+        "Убедитесь, что команда `publish_scheduled` показывает отложенные"
+        " публикации, время которых наступило."
+    )
+
+    published_category.is_published = False
+    published_category.save()
+    assert not Post.published_posts.filter(pk=post.pk).exists(), (
+        "Убедитесь, что публикации скрываются при снятии категории"
+        " с публикации."
+    )